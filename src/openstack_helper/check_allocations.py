@@ -6,15 +6,22 @@ This module retrieves allocation information from Nova and Placement for one or
 instances, computes a status based on allocation consistency, and displays the results
 in a single table using Rich if available or plain text.
 """
+import concurrent.futures
 import logging
 from dataclasses import dataclass
 
 import openstack
 
-from openstack_helper.common import RICH_AVAILABLE, Console, Table
+from openstack_helper import common
+from openstack_helper.common import DATACLASS_SLOTS, RICH_AVAILABLE
 
+# Nova values (vm_name, compute_host, hypervisor_hostname) of a missing instance
+NO_NOVA_DATA = (None, None, None)
+# Rich markup used to display each VmAlloc status
+STATUS_MARKUP = {"OK": "[green]OK[/green]", "Not OK": "[red]Not OK[/red]"}
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class VmAlloc:
     """Data class representing server (VM) allocations."""
 
@@ -40,24 +47,24 @@ class VmAlloc:
         Returns:
             "OK" or "Not OK" based on the conditions above.
         """
-        # If there is no data in Nova nor in Placement, consider it OK.
-        if (
-            self.vm_name is None
-            and self.nova_compute_host is None
-            and self.nova_hypervisor_hostname is None
-            and len(self.placement_alloc) == 0
-        ):
-            return "OK"
-
         # Check if Nova data is valid and consistent with Placement allocation.
+        # This is the common case, so it is checked first.
         if (
             self.nova_compute_host == self.nova_hypervisor_hostname
             and self.placement_alloc is not None
             and len(self.placement_alloc) == 1
-            and list(self.placement_alloc.keys())[0] == self.nova_compute_host
+            and next(iter(self.placement_alloc)) == self.nova_compute_host
         ):
             return "OK"
 
+        # If there is no data in Nova nor in Placement, consider it OK.
+        if (
+            self.vm_name,
+            self.nova_compute_host,
+            self.nova_hypervisor_hostname,
+        ) == NO_NOVA_DATA and not self.placement_alloc:
+            return "OK"
+
         return "Not OK"
 
 
@@ -95,27 +102,64 @@ def check_placement_allocation(openstack_api, vm_uuid):
         vm_uuid: The UUID of the virtual machine.
 
     Returns:
-        A dictionary mapping resource provider names to their allocation resources.
+        A dictionary mapping resource provider UUIDs to their allocation resources.
     """
     allocations = openstack_api.placement.retrieve_provider_allocations_for_instance(vm_uuid)
     logging.debug("Instance: %s Resource provider allocations found: %s", vm_uuid, allocations)
 
-    placement = {}
-    for rp_id, alloc in allocations.items():
-        logging.debug("Getting info about resource provider: %s", rp_id)
-        try:
-            rp = openstack_api.placement.find_resource_provider(rp_id, ignore_missing=False)
-            placement[rp.name] = alloc.get("resources", {})
-        except openstack.exceptions.NotFoundException:
-            logging.warning("Resource provider with ID %s not found", rp_id)
-            # If the resource provider is not found, fallback to using its ID as the key.
-            placement[rp_id] = alloc.get("resources", {})
+    return {rp_id: alloc.get("resources", {}) for rp_id, alloc in allocations.items()}
+
 
-    logging.debug("Instance: %s Placement allocations found: %s", vm_uuid, placement)
-    return placement
+def get_vm_allocation(openstack_api, vm_uuid):
+    """
+    Retrieve allocation details from both Nova and Placement for a single instance.
 
+    Args:
+        openstack_api: An instance of the OpenStackAPI.
+        vm_uuid: The UUID of the virtual machine.
 
-def check_allocations(openstack_api, vm_uuids):
+    Returns:
+        A VmAlloc object containing allocation details, with Placement allocations
+        keyed by resource provider UUID.
+    """
+    nova_alloc = check_nova_allocation(openstack_api, vm_uuid)
+    logging.debug("Server nova compute host: %s", nova_alloc)
+    vm_id, vm_name, nova_compute_host, nova_hypervisor_hostname = nova_alloc
+
+    placement_alloc = check_placement_allocation(openstack_api, vm_uuid)
+    logging.debug("Server placement allocation: %s", placement_alloc)
+
+    return VmAlloc(
+        # Use vm_uuid as the VM ID since the instance may not exist in Nova.
+        vm_id=vm_id if vm_id else vm_uuid,
+        vm_name=vm_name,
+        nova_compute_host=nova_compute_host,
+        nova_hypervisor_hostname=nova_hypervisor_hostname,
+        placement_alloc=placement_alloc,
+    )
+
+
+def get_resource_provider_name(openstack_api, rp_id):
+    """
+    Retrieve the name of a resource provider.
+
+    Args:
+        openstack_api: An instance of the OpenStackAPI.
+        rp_id: The UUID of the resource provider.
+
+    Returns:
+        The resource provider name, or None if the resource provider is not found.
+    """
+    logging.debug("Getting info about resource provider: %s", rp_id)
+    try:
+        rp = openstack_api.placement.find_resource_provider(rp_id, ignore_missing=False)
+        return rp.name
+    except openstack.exceptions.NotFoundException:
+        logging.warning("Resource provider with ID %s not found", rp_id)
+        return None
+
+
+def check_allocations(openstack_api, vm_uuids, max_workers=20):
     """
     Retrieve allocation details from both Nova and Placement for multiple instances.
 
@@ -124,31 +168,56 @@ def check_allocations(openstack_api, vm_uuids):
       2. Queries the Placement API to obtain resource provider allocations.
       3. Constructs a VmAlloc instance containing the collected data.
 
+    Then the resource providers referenced by the allocations are resolved to
+    their names, each one only once. Both steps run concurrently using a thread
+    pool. The results keep the same order as the input UUIDs.
+
     Args:
         openstack_api: An instance of the OpenStackAPI.
         vm_uuids: A list of instance UUID strings.
+        max_workers (int): Maximum number of worker threads for concurrent API calls.
+                           Defaults to 20.
 
     Returns:
         A list of VmAlloc objects containing allocation details and a computed status.
     """
-    results = []
-    for vm_uuid in vm_uuids:
-        nova_alloc = check_nova_allocation(openstack_api, vm_uuid)
-        logging.debug("Server nova compute host: %s", nova_alloc)
-        vm_id, vm_name, nova_compute_host, nova_hypervisor_hostname = nova_alloc
-
-        placement_alloc = check_placement_allocation(openstack_api, vm_uuid)
-        logging.debug("Server placement allocation: %s", placement_alloc)
-
-        vm_alloc = VmAlloc(
-            # Use vm_uuid as the VM ID since the instance may not exist in Nova.
-            vm_id=vm_id if vm_id else vm_uuid,
-            vm_name=vm_name,
-            nova_compute_host=nova_compute_host,
-            nova_hypervisor_hostname=nova_hypervisor_hostname,
-            placement_alloc=placement_alloc,
+    if not vm_uuids:
+        return []
+
+    num_workers = min(max_workers, len(vm_uuids))
+    logging.debug("Using %s threads", num_workers)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as executor:
+        results = list(
+            executor.map(lambda vm_uuid: get_vm_allocation(openstack_api, vm_uuid), vm_uuids)
+        )
+
+    rp_ids = list({rp_id for alloc in results for rp_id in alloc.placement_alloc})
+    logging.debug("Resource providers found: %s", len(rp_ids))
+    if not rp_ids:
+        return results
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(max_workers, len(rp_ids))
+    ) as executor:
+        rp_names = dict(
+            zip(
+                rp_ids,
+                executor.map(
+                    lambda rp_id: get_resource_provider_name(openstack_api, rp_id), rp_ids
+                ),
+            )
+        )
+
+    for alloc in results:
+        # If the resource provider is not found, fallback to using its ID as the key.
+        alloc.placement_alloc = {
+            rp_names[rp_id] or rp_id: resources
+            for rp_id, resources in alloc.placement_alloc.items()
+        }
+        logging.debug(
+            "Instance: %s Placement allocations found: %s", alloc.vm_id, alloc.placement_alloc
         )
-        results.append(vm_alloc)
 
     return results
 
@@ -161,27 +230,26 @@ def display_allocations(results):
         results: A list of VmAlloc objects to display.
     """
     if RICH_AVAILABLE:
-        console = Console()
-        table = Table(show_header=True)
+        console = common.Console()
+        table = common.Table(show_header=True)
         table.add_column("Instance ID", style="magenta", no_wrap=True)
         table.add_column("VM Name", style="blue")
         table.add_column("Nova Allocation", style="cyan", no_wrap=True)
         table.add_column("Placement Allocation", style="cyan")
         table.add_column("Status", style="yellow")
-        for alloc in results:
-            vm_name_str = alloc.vm_name or "N/A"
-            nova_alloc_str = (
+        rows = [
+            (
+                alloc.vm_id,
+                alloc.vm_name or "N/A",
                 f"compute_host: {alloc.nova_compute_host or 'N/A'}, "
-                f"hypervisor: {alloc.nova_hypervisor_hostname or 'N/A'}"
-            )
-            placement_alloc_str = (
-                str(alloc.placement_alloc) if alloc.placement_alloc else "N/A"
-            )
-            color = "green" if alloc.status == "OK" else "red"
-            status_str = f"[{color}]{alloc.status}[/{color}]"
-            table.add_row(
-                alloc.vm_id, vm_name_str, nova_alloc_str, placement_alloc_str, status_str
+                f"hypervisor: {alloc.nova_hypervisor_hostname or 'N/A'}",
+                str(alloc.placement_alloc) if alloc.placement_alloc else "N/A",
+                STATUS_MARKUP[alloc.status],
             )
+            for alloc in results
+        ]
+        for row in rows:
+            table.add_row(*row)
         console.print(table)
     else:
         print("---- Allocations for Instances ----")
@@ -204,9 +272,10 @@ def handle_check_allocations_cmd(openstack_api, args):
         openstack_api (OpenStackAPI): Instance of OpenStackAPI.
         args (argparse.Namespace): Parsed command-line arguments.
            - uuid: A string of one or more comma-separated UUIDs.
+           - max_workers: Maximum number of worker threads for API calls.
     """
     vm_uuids = args.uuid.split(",")
-    results = check_allocations(openstack_api, vm_uuids)
+    results = check_allocations(openstack_api, vm_uuids, max_workers=args.max_workers)
     display_allocations(results)
 
 
@@ -2,32 +2,65 @@
 """
 openstack-helper - utils
 """
+import concurrent.futures
+import importlib
+import importlib.util
 import ipaddress
 import logging
+import re
+import shutil
 import subprocess  # nosec B404
-import uuid
-
-try:
-    from rich.console import Console, Group
-    from rich.table import Table
-    from rich.text import Text
-    from rich.tree import Tree
-
-    RICH_AVAILABLE = True
-    __all__ = ["RICH_AVAILABLE", "Console", "Group", "Table", "Text", "Tree"]
-except ImportError:
-    RICH_AVAILABLE = False
-    Console = None
-    Group = None
-    Table = None
-    Text = None
-    Tree = None
-    __all__ = ["RICH_AVAILABLE", "Console", "Group", "Table", "Text", "Tree"]
+import sys
+
+# Rich is an optional dependency. Its classes are only imported on first access
+# (see __getattr__ below), so importing this module does not load Rich.
+RICH_AVAILABLE = importlib.util.find_spec("rich") is not None
+RICH_CLASSES = {
+    "Console": "rich.console",
+    "Group": "rich.console",
+    "Table": "rich.table",
+    "Text": "rich.text",
+    "Tree": "rich.tree",
+}
+
+# Keyword arguments to create slotted dataclasses, i.e. '@dataclass(**DATACLASS_SLOTS)'.
+# The 'slots' parameter is only available on Python 3.10+.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Canonical UUID representation (8-4-4-4-12 hexadecimal digits)
+UUID_PATTERN = re.compile(
+    r"\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z"
+)
+
+
+def __getattr__(name):
+    """
+    Import the Rich classes lazily, on first access.
+
+    Args:
+        name (str): The name of the attribute being accessed.
+
+    Returns:
+        The Rich class, or None if Rich is not installed.
+
+    Raises:
+        AttributeError: If name is not a Rich class exported by this module.
+    """
+    if name not in RICH_CLASSES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    rich_class = None
+    if RICH_AVAILABLE:
+        rich_class = getattr(importlib.import_module(RICH_CLASSES[name]), name)
+    # Cache it as a module global, so __getattr__ is not called again
+    globals()[name] = rich_class
+    return rich_class
 
 
 def is_valid_uuid(uuid_str):
     """
-    Check if uuid_str parameter is a valid UUID.
+    Check if uuid_str parameter is a valid UUID in its canonical form
+    (e.g., '123e4567-e89b-12d3-a456-426614174000').
 
     Args:
         uuid_str (str): The value to check.
@@ -35,11 +68,7 @@ def is_valid_uuid(uuid_str):
     Returns:
         bool: True if valid UUID, False otherwise.
     """
-    try:
-        uuid.UUID(str(uuid_str))
-        return True
-    except ValueError:
-        return False
+    return UUID_PATTERN.match(str(uuid_str)) is not None
 
 
 def is_valid_ip_address(address):
@@ -96,4 +125,89 @@ def ping_ip_address(ip, timeout=1):
         return False
 
 
+def ping_each_ip_address(ips, timeout=1, max_workers=20):
+    """
+    Ping each IP address with its own ping process, using a thread pool.
+
+    Args:
+        ips (list): The valid IP addresses to ping.
+        timeout (int): The timeout duration in seconds for each IP address.
+                       Defaults to 1 second.
+        max_workers (int): Maximum number of worker threads. Defaults to 20.
+
+    Returns:
+        set: The IP addresses that respond to ping.
+    """
+    num_workers = min(max_workers, len(ips))
+    logging.debug("Pinging IP addresses using %s threads", num_workers)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as executor:
+        results = executor.map(lambda ip: ping_ip_address(ip, timeout=timeout), ips)
+        return {ip for ip, is_reachable in zip(ips, results) if is_reachable}
+
+
+def ping_ip_addresses(ips, timeout=1, max_workers=20):
+    """
+    Ping multiple IP addresses to check which ones are reachable.
+
+    If 'fping' is installed, all IP addresses are pinged concurrently by a single
+    fping process. Otherwise, or if fping fails to run, it falls back to ping each
+    IP address with its own ping process, using a thread pool.
+
+    Args:
+        ips (list): The IP addresses to ping.
+        timeout (int): The timeout duration in seconds for each IP address.
+                       Defaults to 1 second.
+        max_workers (int): Maximum number of worker threads for the ping fallback.
+                           Defaults to 20.
+
+    Returns:
+        set: The IP addresses that respond to ping.
+    """
+    valid_ips = []
+    for ip in ips:
+        if is_valid_ip_address(ip):
+            valid_ips.append(ip)
+        else:
+            logging.error("Invalid IP address: %s", ip)
+
+    if not valid_ips:
+        return set()
+
+    fping_path = shutil.which("fping")
+    if not fping_path:
+        logging.debug("fping command not found")
+        return ping_each_ip_address(valid_ips, timeout=timeout, max_workers=max_workers)
+
+    logging.debug("Trying to ping: %s", valid_ips)
+
+    # -a: show only reachable targets, -q: quiet, -r 0: no retries, -t: timeout in ms
+    command = [fping_path, "-a", "-q", "-r", "0", "-t", str(int(timeout * 1000)), *valid_ips]
+
+    try:
+        output = subprocess.run(
+            command,
+            shell=False,
+            check=False,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )  # nosec B603
+    except OSError as e:
+        logging.error("Error executing fping command: %s", e)
+        return ping_each_ip_address(valid_ips, timeout=timeout, max_workers=max_workers)
+
+    # fping exits with 0 if all targets are reachable and 1 if some are not.
+    # Any other code is an error (e.g. invalid arguments or no raw socket
+    # permission), and its empty output must not be read as "nothing reachable".
+    if output.returncode not in (0, 1):
+        logging.error(
+            "fping command failed with exit code %s: %s",
+            output.returncode,
+            output.stderr.strip(),
+        )
+        return ping_each_ip_address(valid_ips, timeout=timeout, max_workers=max_workers)
+
+    return set(output.stdout.split())
+
+
 # vim: ts=4 sw=4 expandtab
@@ -2,22 +2,30 @@
 """
 openstack-helper - image usage command
 """
+import concurrent.futures
 import datetime
 import logging
 from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import NamedTuple
 
-from openstack_helper.common import RICH_AVAILABLE, Console, Table
+from openstack_helper import common
+from openstack_helper.common import DATACLASS_SLOTS, RICH_AVAILABLE
 
+# Timestamp format used by Glance
+GLANCE_DATE_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+# Format of each server line in the "VM IDs and Names" column
+VM_DETAILS_FORMAT = "{0.id} ({0.name})"
 
-@dataclass
-class ServerInfo:
-    """Data class representing server (VM) information."""
+
+class ServerInfo(NamedTuple):
+    """Named tuple representing server (VM) information."""
 
     id: str
     name: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ImageInfo:
     """Data class representing image information and associated servers."""
 
@@ -29,6 +37,10 @@ class ImageInfo:
     servers: list = field(default_factory=list)
 
 
+# Retrieve the ImageInfo fields, in declaration order, from an SDK image
+get_image_fields = attrgetter("id", "name", "status", "visibility", "created_at")
+
+
 def get_filtered_images(openstack_api, args):
     """
     Retrieve and filter images based on provided arguments.
@@ -42,44 +54,25 @@ def get_filtered_images(openstack_api, args):
     """
     image_info_map = {}
 
-    # Prepare the query parameters
+    # Prepare the query parameters. All filters are applied by Glance.
     query_params = {}
     if args.name:
         query_params["name"] = args.name
     if args.tag:
         query_params["tag"] = args.tag.split(",")
+    if args.image_id:
+        query_params["id"] = args.image_id
+    if args.days:
+        # Images created at least 'days' ago
+        cutoff_date = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(
+            days=args.days
+        )
+        query_params["created_at"] = f"lte:{cutoff_date.strftime(GLANCE_DATE_FORMAT)}"
     logging.debug("Retrieving images with query params: %s", query_params)
 
-    current_date = datetime.datetime.utcnow()
-
     for img in openstack_api.image.list_images(**query_params):
-        # Filter by creation date
-        if args.days and img.created_at:
-            delta = current_date - datetime.datetime.strptime(
-                img.created_at, "%Y-%m-%dT%H:%M:%SZ"
-            )
-            num_days = delta.days
-            logging.debug("num_days: %s", num_days)
-            if num_days < args.days:
-                logging.debug(
-                    "Excluding by image days filter: %s created %s days ago", img.id, num_days
-                )
-                continue
-        # Filter by image ID
-        if args.image_id and args.image_id != img.id:
-            logging.debug("Excluding by image id filter: %s", img.id)
-            continue
-
         logging.debug("Getting details of image: %s (%s)", img.name, img.id)
-        image_info = ImageInfo(
-            id=img.id,
-            name=img.name,
-            status=img.status,
-            visibility=img.visibility,
-            created_at=img.created_at,
-            servers=[],
-        )
-        image_info_map[img.id] = image_info
+        image_info_map[img.id] = ImageInfo(*get_image_fields(img))
 
     return image_info_map
 
@@ -132,22 +125,47 @@ def get_boot_volume_image_id(server, openstack_api):
     return server_image_id
 
 
-def add_servers_to_images(openstack_api, image_info_map, all_projects=False):
+def get_servers_image_ids(openstack_api, all_projects=False, max_workers=20):
     """
-    Associate servers with their corresponding images in place.
+    Retrieve servers and the ID of the image each one is using.
+
+    Servers booted from volume need extra volume lookups to find their image.
+    These lookups are done concurrently across servers, while the volumes of
+    each server are looked up sequentially, so at most max_workers volume
+    requests are in flight at once.
 
     Args:
         openstack_api: Instance of OpenStackAPI.
-        image_info_map (Dict[str, ImageInfo]): Dictionary mapping image IDs to
-            ImageInfo instances.
         all_projects (bool): Whether to include servers from all projects.
+        max_workers (int): Maximum number of worker threads for concurrent volume
+                           lookups. Defaults to 20.
 
-    Mutates:
-        image_info_map: Updated in-place with servers added to corresponding images.
+    Returns:
+        List[Tuple[Server, str]]: A list of (server, image_id) tuples, in server
+            listing order. image_id is None if the image could not be detected.
     """
     logging.debug("Listing servers. all_projects=%s", all_projects)
 
-    for server in openstack_api.compute.list_servers(all_projects=all_projects):
+    servers = openstack_api.compute.list_servers(all_projects=all_projects)
+
+    # handle boot from volume
+    volume_servers = [server for server in servers if not server.image.get("id", None)]
+    volume_image_ids = {}
+    if volume_servers:
+        num_workers = min(max_workers, len(volume_servers))
+        logging.debug(
+            "Checking volumes of %s servers using %s threads", len(volume_servers), num_workers
+        )
+        with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as executor:
+            image_ids = executor.map(
+                lambda server: get_boot_volume_image_id(server, openstack_api), volume_servers
+            )
+            volume_image_ids = {
+                server.id: image_id for server, image_id in zip(volume_servers, image_ids)
+            }
+
+    servers_image_ids = []
+    for server in servers:
         logging.debug("Checking information for server: %s id: %s", server.name, server.id)
 
         server_image_id = server.image.get("id", None)
@@ -155,10 +173,28 @@ def add_servers_to_images(openstack_api, image_info_map, all_projects=False):
         if server_image_id:
             logging.debug("Server %s using image %s", server.name, server_image_id)
         else:
-            # handle boot from volume
-            logging.debug("Server %s: no direct image found. Checking volumes...", server.name)
-            server_image_id = get_boot_volume_image_id(server, openstack_api)
+            logging.debug("Server %s: no direct image found. Using volumes image", server.name)
+            server_image_id = volume_image_ids.get(server.id)
+
+        servers_image_ids.append((server, server_image_id))
+
+    return servers_image_ids
+
+
+def add_servers_to_images(image_info_map, servers_image_ids):
+    """
+    Associate servers with their corresponding images in place.
+
+    Args:
+        image_info_map (Dict[str, ImageInfo]): Dictionary mapping image IDs to
+            ImageInfo instances.
+        servers_image_ids (List[Tuple[Server, str]]): List of (server, image_id)
+            tuples, as returned by get_servers_image_ids.
 
+    Mutates:
+        image_info_map: Updated in-place with servers added to corresponding images.
+    """
+    for server, server_image_id in servers_image_ids:
         if server_image_id in image_info_map:
             server_info = ServerInfo(id=server.id, name=server.name)
             image_info_map[server_image_id].servers.append(server_info)
@@ -170,7 +206,7 @@ def add_servers_to_images(openstack_api, image_info_map, all_projects=False):
             )
 
 
-def print_results(image_info_map, show_vm_details, show_no_vms):
+def print_results(image_info_map, show_vm_details, only_no_vms):
     """
     Print image usage information in a table format.
 
@@ -178,20 +214,18 @@ def print_results(image_info_map, show_vm_details, show_no_vms):
         image_info_map (Dict[str, ImageInfo]): Dictionary mapping image IDs to
             ImageInfo instances.
         show_vm_details (bool): Whether to display VM IDs and Names.
-        show_no_vms (bool): Whether to include images with no VMs.
+        only_no_vms (bool): Whether to display only images with no VMs.
     """
-
-    images_to_display = []
-
-    # Apply show_no_vms filter
-    for image_info in image_info_map.values():
-        if show_no_vms and len(image_info.servers) > 0:
-            continue
-        images_to_display.append(image_info)
+    if only_no_vms:
+        images_to_display = [
+            image_info for image_info in image_info_map.values() if not image_info.servers
+        ]
+    else:
+        images_to_display = list(image_info_map.values())
 
     if RICH_AVAILABLE:
-        console = Console()
-        table = Table(show_header=True)
+        console = common.Console()
+        table = common.Table(show_header=True)
 
         table.add_column("Image ID", style="cyan", no_wrap=True)
         table.add_column("Image Name", style="green")
@@ -213,10 +247,7 @@ def print_results(image_info_map, show_vm_details, show_no_vms):
             ]
             if show_vm_details:
                 vm_details = (
-                    "\n".join(
-                        [f"{server.id} ({server.name})" for server in image_info.servers]
-                    )
-                    or "No VMs"
+                    "\n".join(map(VM_DETAILS_FORMAT.format, image_info.servers)) or "No VMs"
                 )
                 row.append(vm_details)
 
@@ -224,8 +255,6 @@ def print_results(image_info_map, show_vm_details, show_no_vms):
         console.print(table)
     else:
         for image_info in images_to_display:
-            if show_no_vms and len(image_info.servers) > 0:
-                continue
             print(f"Image ID: {image_info.id}")
             print(f"Image Name: {image_info.name}")
             print(f"Image Status: {image_info.status}")
@@ -246,12 +275,22 @@ def handle_images_usage_cmd(openstack_api, args):
         openstack_api (OpenStackAPI): Instance of OpenStackAPI.
         args (argparse.Namespace): Parsed command-line arguments.
     """
-    image_info_map = get_filtered_images(openstack_api, args)
+    # Images and servers are independent queries, so retrieve servers
+    # (and their boot volumes) in the background while images are listed
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        servers_future = executor.submit(
+            get_servers_image_ids,
+            openstack_api,
+            all_projects=args.all_projects,
+            max_workers=args.max_workers,
+        )
+        image_info_map = get_filtered_images(openstack_api, args)
+        servers_image_ids = servers_future.result()
 
     # Enrich image_info_map with servers info (in-place)
-    add_servers_to_images(openstack_api, image_info_map, all_projects=args.all_projects)
+    add_servers_to_images(image_info_map, servers_image_ids)
 
-    print_results(image_info_map, args.show_vm_details, args.show_no_vms)
+    print_results(image_info_map, args.show_vm_details, only_no_vms=args.show_no_vms)
 
 
 # vim: ts=4 sw=4 expandtab
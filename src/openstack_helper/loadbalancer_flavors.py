@@ -6,15 +6,34 @@ This module provides functionality for retrieving and displaying
 OpenStack load balancer flavors, along with their associated
 flavor profiles and compute flavors.
 """
+import concurrent.futures
 import json
 import logging
-from dataclasses import asdict, dataclass
+import sys
+import threading
+from dataclasses import dataclass, fields
+from operator import attrgetter
 from typing import Optional
 
-from openstack_helper.common import RICH_AVAILABLE, Console, Table, Tree
-
-
-@dataclass
+from openstack_helper import common
+from openstack_helper.common import DATACLASS_SLOTS, RICH_AVAILABLE
+
+# Attributes and templates used to build the basic flavor information
+get_flavor_basic_fields = attrgetter("id", "name", "description", "is_enabled")
+get_profile_info_fields = attrgetter("name", "provider_name")
+get_compute_info_fields = attrgetter("name", "vcpus", "ram")
+PROFILE_INFO_TEMPLATE = "%s (Provider: %s)"
+COMPUTE_INFO_TEMPLATE = "%s (Resources: vCPUs:%s RAM:%s)"
+# Templates used to display the detailed flavor information
+FLAVOR_HEADER_TEMPLATE = "[cyan]Flavor Id:[/cyan] %s ([magenta]%s[/magenta])"
+FLAVOR_FIELD_TEMPLATE = "[cyan]%s:[/cyan] %s"
+PLAIN_FLAVOR_HEADER_TEMPLATE = "Flavor Id: %s (%s)"
+PLAIN_FLAVOR_FIELD_TEMPLATE = "  %s: %s"
+# Guards the lookup caches shared by the flavor worker threads
+CACHE_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ComputeFlavor:
     """
     Data class representing a compute flavor
@@ -36,7 +55,7 @@ class ComputeFlavor:
     extra_specs: str
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class FlavorProfile:
     """
     Data class representing a flavor profile.
@@ -73,7 +92,7 @@ class FlavorProfile:
         return compute_flavor
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Flavor:
     """
     Data class representing a load balancer flavor
@@ -101,22 +120,18 @@ class Flavor:
         Returns:
             A tuple (flavor_id, name, description, enabled, profile_info, compute_info)
         """
-        flavor_id = self.id
-        name = self.name
-        description = self.description
-        enabled = str(self.is_enabled)
+        flavor_id, name, description, is_enabled = get_flavor_basic_fields(self)
         profile_info = (
-            f"{self.flavor_profile.name} (Provider: {self.flavor_profile.provider_name})"
+            PROFILE_INFO_TEMPLATE % get_profile_info_fields(self.flavor_profile)
             if self.flavor_profile
             else "N/A"
         )
         compute_info = (
-            f"{self.compute_flavor.name} "
-            f"(Resources: vCPUs:{self.compute_flavor.vcpus} RAM:{self.compute_flavor.ram})"
+            COMPUTE_INFO_TEMPLATE % get_compute_info_fields(self.compute_flavor)
             if self.compute_flavor
             else "N/A"
         )
-        return flavor_id, name, description, enabled, profile_info, compute_info
+        return flavor_id, name, description, str(is_enabled), profile_info, compute_info
 
     def get_detailed_info(self):
         """
@@ -130,40 +145,90 @@ class Flavor:
         """
         info = {}
 
-        # Convert the flavor dataclass to a dict and merge it into info.
-        flavor_dict = asdict(self)
-        for key, value in flavor_dict.items():
-            # Do not add flavor profile and compute flavor in the flavor level
-            if key in ["flavor_profile", "compute_flavor"]:
-                continue
-            info[f"Flavor {key.capitalize()}"] = value
+        # Do not add flavor profile and compute flavor in the flavor level
+        for name, label in FLAVOR_DETAIL_FIELDS:
+            info[label] = getattr(self, name)
 
         if self.flavor_profile:
-            # Convert the flavor_profile dataclass to a dict and merge it into info.
-            fp_dict = asdict(self.flavor_profile)
-            for key, value in fp_dict.items():
-                info[f"Flavor_Profile {key.capitalize()}"] = value
+            for name, label in FLAVOR_PROFILE_DETAIL_FIELDS:
+                info[label] = getattr(self.flavor_profile, name)
         else:
             info["Flavor_Profile"] = "N/A"
 
         if self.compute_flavor:
-            # Convert the compute_flavor dataclass to a dict and merge it into info.
-            cf_dict = asdict(self.compute_flavor)
-            for key, value in cf_dict.items():
-                info[f"Compute_Flavor {key.capitalize()}"] = value
+            for name, label in COMPUTE_FLAVOR_DETAIL_FIELDS:
+                info[label] = getattr(self.compute_flavor, name)
         else:
             info["Compute_Flavor"] = "N/A"
 
         return info
 
 
-def get_lb_flavor_profile(openstack_api, flavor):
+def get_detail_fields(dataclass_type, prefix, exclude=()):
+    """
+    Build the (field name, display label) pairs used by Flavor.get_detailed_info.
+
+    Args:
+        dataclass_type (dataclass): The dataclass type to get the fields from.
+        prefix (str): Prefix added to each capitalized field name.
+        exclude (tuple): Field names to leave out.
+
+    Returns:
+        Tuple[Tuple[str, str], ...]: The field names and their display labels.
+    """
+    return tuple(
+        (field_obj.name, f"{prefix} {field_obj.name.capitalize()}")
+        for field_obj in fields(dataclass_type)
+        if field_obj.name not in exclude
+    )
+
+
+FLAVOR_DETAIL_FIELDS = get_detail_fields(
+    Flavor, "Flavor", exclude=("flavor_profile", "compute_flavor")
+)
+FLAVOR_PROFILE_DETAIL_FIELDS = get_detail_fields(FlavorProfile, "Flavor_Profile")
+COMPUTE_FLAVOR_DETAIL_FIELDS = get_detail_fields(ComputeFlavor, "Compute_Flavor")
+
+
+def cached_find(cache, name_or_id, find_func):
+    """
+    Call find_func(name_or_id) only if its result is not already in the cache.
+
+    The cache stores a Future per name_or_id, so concurrent callers asking for
+    the same resource wait for a single find_func call instead of repeating it.
+
+    Args:
+        cache (dict or None): Dictionary of Futures of previous results keyed by
+            name_or_id. If None, no cache is used.
+        name_or_id (str): The name or ID of the resource to find.
+        find_func (callable): Function that retrieves the resource.
+
+    Returns:
+        The resource returned by find_func (possibly from the cache).
+    """
+    if cache is None:
+        return find_func(name_or_id)
+
+    new_future = concurrent.futures.Future()
+    with CACHE_LOCK:
+        future = cache.setdefault(name_or_id, new_future)
+    if future is new_future:
+        try:
+            future.set_result(find_func(name_or_id))
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            future.set_exception(exc)
+    return future.result()
+
+
+def get_lb_flavor_profile(openstack_api, flavor, profile_cache=None):
     """
     Retrieve and construct the FlavorProfile for a given flavor.
 
     Args:
         openstack_api: The OpenStack API client.
         flavor: A flavor object from the loadbalancer service.
+        profile_cache (dict, optional): Cache of flavor profiles already retrieved,
+            keyed by flavor profile ID.
 
     Returns:
         A FlavorProfile instance if found; otherwise, None.
@@ -172,7 +237,9 @@ def get_lb_flavor_profile(openstack_api, flavor):
         logging.warning("Flavor %s does not have a flavor_profile_id attribute", flavor.id)
         return None
 
-    fprofile = openstack_api.loadbalancer.find_flavor_profile(flavor.flavor_profile_id)
+    fprofile = cached_find(
+        profile_cache, flavor.flavor_profile_id, openstack_api.loadbalancer.find_flavor_profile
+    )
     if not fprofile:
         logging.warning(
             "Flavor %s missing associated flavor profile (ID: %s)",
@@ -195,13 +262,15 @@ def get_lb_flavor_profile(openstack_api, flavor):
         return None
 
 
-def get_compute_flavor(openstack_api, flavor_profile):
+def get_compute_flavor(openstack_api, flavor_profile, compute_cache=None):
     """
     Retrieve and construct the ComputeFlavor using the flavor profile's data.
 
     Args:
         openstack_api: The OpenStack API client.
         flavor_profile: A FlavorProfile instance.
+        compute_cache (dict, optional): Cache of compute flavors already retrieved,
+            keyed by compute flavor ID.
 
     Returns:
         A ComputeFlavor instance if the 'compute_flavor' key exists and the flavor is found;
@@ -211,7 +280,9 @@ def get_compute_flavor(openstack_api, flavor_profile):
     if not compute_flavor_value:
         return None
 
-    compute_flavor = openstack_api.compute.find_flavor(compute_flavor_value)
+    compute_flavor = cached_find(
+        compute_cache, compute_flavor_value, openstack_api.compute.find_flavor
+    )
     if not compute_flavor:
         logging.warning(
             "No compute flavor found for compute_flavor_id %s.", compute_flavor_value
@@ -234,6 +305,18 @@ def get_compute_flavor(openstack_api, flavor_profile):
         return None
 
 
+# Columns of the basic flavor view, in Flavor.get_basic_info order.
+# Each column is a (header, Rich column style) tuple.
+FLAVORS_BASIC_COLUMNS = (
+    ("Flavor Id", {"style": "cyan", "no_wrap": True}),
+    ("Name", {"style": "magenta"}),
+    ("Description", {"style": "green"}),
+    ("Enabled", {"style": "yellow"}),
+    ("Flavor Profile", {"style": "blue"}),
+    ("Compute Flavor", {"style": "red"}),
+)
+
+
 def display_flavors_basic(flavors_list):
     """
     Display basic flavor information
@@ -242,29 +325,21 @@ def display_flavors_basic(flavors_list):
         flavors_list (list): A list of Flavor objects
     """
     if RICH_AVAILABLE:
-        console = Console()
-        table = Table(title="Load Balancer Flavors")
-        table.add_column("Flavor Id", style="cyan", no_wrap=True)
-        table.add_column("Name", style="magenta")
-        table.add_column("Description", style="green")
-        table.add_column("Enabled", style="yellow")
-        table.add_column("Flavor Profile", style="blue")
-        table.add_column("Compute Flavor", style="red")
+        console = common.Console()
+        table = common.Table(title="Load Balancer Flavors")
+        for header, style in FLAVORS_BASIC_COLUMNS:
+            table.add_column(header, **style)
 
         for flavor in flavors_list:
             table.add_row(*flavor.get_basic_info())
         console.print(table)
     else:
-        # Fallback plain text output
-        print("Load Balancer Flavors:")
-        header = " | ".join(
-            ["Flavor Id", "Name", "Description", "Enabled", "Flavor Profile", "Compute Flavor"]
-        )
-        print(header)
-        print("-" * len(header))
+        # Fallback plain text output, written at once
+        header = " | ".join(header for header, _ in FLAVORS_BASIC_COLUMNS)
+        lines = ["Load Balancer Flavors:", header, "-" * len(header)]
         for flavor in flavors_list:
-            row = flavor.get_basic_info()
-            print(" | ".join(row))
+            lines.append(" | ".join(flavor.get_basic_info()))
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def display_flavors_detail(flavors_list):
@@ -275,8 +350,8 @@ def display_flavors_detail(flavors_list):
         flavors_list (list): A list of Flavor objects
     """
     if RICH_AVAILABLE:
-        console = Console()
-        root_tree = Tree(
+        console = common.Console()
+        root_tree = common.Tree(
             "[bold blue]Load Balancer Flavors[/bold blue]",
             guide_style="bright_blue",
             highlight=True,
@@ -286,21 +361,22 @@ def display_flavors_detail(flavors_list):
             info = flavor.get_detailed_info()
             # Display header with Flavor Id and Flavor Name
             flavor_node = root_tree.add(
-                f"[cyan]Flavor Id:[/cyan] {info.get('Flavor Id')} "
-                f"([magenta]{info.get('Flavor Name')}[/magenta])"
+                FLAVOR_HEADER_TEMPLATE % (info.get("Flavor Id"), info.get("Flavor Name"))
             )
-            for key, value in info.items():
-                flavor_node.add(f"[cyan]{key}:[/cyan] {value}")
+            for item in info.items():
+                flavor_node.add(FLAVOR_FIELD_TEMPLATE % item)
         console.print(root_tree)
     else:
-        # Fallback plain text output
-        print("Load Balancer Flavors:")
+        # Fallback plain text output, written at once
+        lines = ["Load Balancer Flavors:"]
         for flavor in flavors_list:
             info = flavor.get_detailed_info()
-            print(f"Flavor Id: {info.get('Flavor Id')} ({info.get('Flavor Name')})")
-            for key, value in info.items():
-                print(f"  {key}: {value}")
-            print("-" * 40)
+            lines.append(
+                PLAIN_FLAVOR_HEADER_TEMPLATE % (info.get("Flavor Id"), info.get("Flavor Name"))
+            )
+            lines.extend(PLAIN_FLAVOR_FIELD_TEMPLATE % item for item in info.items())
+            lines.append("-" * 40)
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def display_flavors(flavors_list, detail):
@@ -317,6 +393,49 @@ def display_flavors(flavors_list, detail):
         display_flavors_basic(flavors_list)
 
 
+def get_flavor(openstack_api, flavor, profile_cache=None, compute_cache=None):
+    """
+    Construct a Flavor with its associated FlavorProfile and ComputeFlavor.
+
+    Args:
+        openstack_api: The OpenStack API client.
+        flavor: A flavor object from the loadbalancer service.
+        profile_cache (dict, optional): Cache of flavor profiles already retrieved.
+        compute_cache (dict, optional): Cache of compute flavors already retrieved.
+
+    Returns:
+        A Flavor instance.
+    """
+    logging.debug("Processing load balancer flavor: %s", flavor)
+
+    # Retrieve the associated FlavorProfile for this flavor
+    flavor_profile_obj = get_lb_flavor_profile(openstack_api, flavor, profile_cache)
+    logging.debug("Flavor profile associated: %s", flavor_profile_obj)
+
+    # If a FlavorProfile exists, retrieve the ComputeFlavor using its data;
+    # otherwise, set the compute flavor object to None
+    if flavor_profile_obj:
+        compute_flavor_obj = get_compute_flavor(
+            openstack_api, flavor_profile_obj, compute_cache
+        )
+    else:
+        compute_flavor_obj = None
+    logging.debug("Compute flavor associated: %s", compute_flavor_obj)
+
+    # Construct a Flavor object
+    flavor_obj = Flavor(
+        id=flavor.id,
+        name=flavor.name,
+        description=flavor.description,
+        is_enabled=flavor.is_enabled,
+        flavor_profile=flavor_profile_obj,
+        compute_flavor=compute_flavor_obj,
+    )
+    logging.debug("Dataclass flavor object: %s", flavor_obj)
+
+    return flavor_obj
+
+
 def handle_lb_flavors_cmd(openstack_api, args):
     """
     Handle the 'lb_flavors' subcommand
@@ -331,35 +450,29 @@ def handle_lb_flavors_cmd(openstack_api, args):
     if args.flavor_name:
         filters["name"] = args.flavor_name
 
-    flavors_list = []
-
-    for flavor in openstack_api.loadbalancer.list_flavors(**filters):
-        logging.debug("Processing load balancer flavor: %s", flavor)
-
-        # Retrieve the associated FlavorProfile for this flavor
-        flavor_profile_obj = get_lb_flavor_profile(openstack_api, flavor)
-        logging.debug("Flavor profile associated: %s", flavor_profile_obj)
+    flavors = openstack_api.loadbalancer.list_flavors(**filters)
 
-        # If a FlavorProfile exists, retrieve the ComputeFlavor using its data;
-        # otherwise, set the compute flavor object to None
-        if flavor_profile_obj:
-            compute_flavor_obj = get_compute_flavor(openstack_api, flavor_profile_obj)
-        else:
-            compute_flavor_obj = None
-        logging.debug("Compute flavor associated: %s", compute_flavor_obj)
-
-        # Construct a Flavor object
-        flavor_obj = Flavor(
-            id=flavor.id,
-            name=flavor.name,
-            description=flavor.description,
-            is_enabled=flavor.is_enabled,
-            flavor_profile=flavor_profile_obj,
-            compute_flavor=compute_flavor_obj,
-        )
-        logging.debug("Dataclass flavor object: %s", flavor_obj)
+    # Many flavors share the same flavor profile and compute flavor. Cache the
+    # lookups so each one is retrieved only once.
+    profile_cache = {}
+    compute_cache = {}
 
-        flavors_list.append(flavor_obj)
+    flavors_list = []
+    if flavors:
+        num_workers = min(args.max_workers, len(flavors))
+        logging.debug("Using %s threads", num_workers)
+
+        # Flavor profile and compute flavor lookups are done concurrently per flavor.
+        # executor.map keeps the flavors in the listing order.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as executor:
+            flavors_list = list(
+                executor.map(
+                    lambda flavor: get_flavor(
+                        openstack_api, flavor, profile_cache, compute_cache
+                    ),
+                    flavors,
+                )
+            )
 
     display_flavors(flavors_list, args.detail)
 
@@ -4,21 +4,30 @@
 import logging
 import sys
 
+HANDLER_NAME = "openstack_helper"
+
+FORMATTER = logging.Formatter(
+    fmt="%(asctime)s %(module)s - %(funcName)s [%(levelname)s] %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
 
 def setup_logging(log_level=logging.INFO):
-    """Setup logging configuration for the application."""
-    datefmt = "%Y-%m-%d %H:%M:%S"
-    msg_fmt = "%(asctime)s %(module)s - %(funcName)s [%(levelname)s] %(message)s"
-
-    formatter = logging.Formatter(
-        fmt=msg_fmt,
-        datefmt=datefmt,
-    )
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(formatter)
+    """
+    Setup logging configuration for the application.
 
+    If the handler was already added by a previous call, only the log level
+    is updated, so log lines are never duplicated.
+    """
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
+
+    if any(handler.get_name() == HANDLER_NAME for handler in root_logger.handlers):
+        return
+
+    handler = logging.StreamHandler(sys.stdout)
+    handler.set_name(HANDLER_NAME)
+    handler.setFormatter(FORMATTER)
     root_logger.addHandler(handler)
 
 
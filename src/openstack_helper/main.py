@@ -17,18 +17,17 @@ for details on each subcommand. Requires Python 3.7+ and appropriate OpenStack
 configuration.
 """
 import argparse
+import importlib
 import logging
+import re
 import sys
 
-from openstack_helper.check_allocations import handle_check_allocations_cmd
 from openstack_helper.common import is_valid_uuid
-from openstack_helper.images_usage import handle_images_usage_cmd
-from openstack_helper.loadbalancer_flavors import handle_lb_flavors_cmd
 from openstack_helper.logging_config import setup_logging
-from openstack_helper.openstack_api import OpenStackAPI
-from openstack_helper.resource_provider import handle_resource_provider_cmd
-from openstack_helper.routers_info import handle_routers_info_cmd
-from openstack_helper.unused_ports import handle_unused_ports_cmd
+
+# Items of a comma-separated list, without surrounding whitespace. Whitespace
+# inside an item is kept, so "a b" stays a single (invalid) item.
+UUID_LIST_ITEM_PATTERN = re.compile(r"[^,\s](?:[^,]*[^,\s])?")
 
 
 def parse_uuid(uuid_str):
@@ -50,6 +49,58 @@ def parse_uuid(uuid_str):
     return uuid_str
 
 
+def parse_pool_size(pool_size_str):
+    """
+    Parses and validates the HTTP connection pool size.
+
+    Args:
+        pool_size_str (str): The pool size string to validate.
+
+    Returns:
+        int: The validated pool size.
+
+    Raises:
+        argparse.ArgumentTypeError: If the pool size is not an integer of at least 1.
+    """
+    try:
+        pool_size = int(pool_size_str)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid pool size: '{pool_size_str}'") from None
+
+    if pool_size < 1:
+        raise argparse.ArgumentTypeError(
+            f"Invalid pool size: '{pool_size_str}'. It must be at least 1."
+        )
+
+    return pool_size
+
+
+def parse_max_workers(max_workers_str):
+    """
+    Parses and validates the maximum number of worker threads.
+
+    Args:
+        max_workers_str (str): The number of worker threads to validate.
+
+    Returns:
+        int: The validated number of worker threads.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not an integer between 1 and 100.
+    """
+    try:
+        max_workers = int(max_workers_str)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid max workers: '{max_workers_str}'") from None
+
+    if max_workers < 1 or max_workers > 100:
+        raise argparse.ArgumentTypeError(
+            f"Invalid max workers: '{max_workers_str}'. It must be between 1 and 100."
+        )
+
+    return max_workers
+
+
 def parse_uuid_list(uuids_str):
     """
     Parses and validates a comma-separated list of UUIDs.
@@ -64,8 +115,8 @@ def parse_uuid_list(uuids_str):
         argparse.ArgumentTypeError: If any UUID is invalid or
             if no UUIDs are provided.
     """
-    # Split the input string by commas and strip whitespace
-    uuids = [u.strip() for u in uuids_str.split(",") if u.strip()]
+    # Split the input string by commas, dropping whitespace and empty items
+    uuids = UUID_LIST_ITEM_PATTERN.findall(uuids_str)
 
     if not uuids:
         raise argparse.ArgumentTypeError("No UUIDs provided.")
@@ -106,6 +157,16 @@ def parse_args():
         action="store_true",
         help="disable TLS certificate verification for OpenStack API connections",
     )
+    parser.add_argument(
+        "--pool-size",
+        type=parse_pool_size,
+        default=20,
+        help=(
+            "maximum number of HTTP connections kept per OpenStack endpoint."
+            " It is raised to the subcommand --max-workers value when that is higher"
+            " (default: %(default)s)"
+        ),
+    )
 
     # Add subcommands options
     subparsers = parser.add_subparsers(required=True, dest="command")
@@ -147,11 +208,13 @@ def parse_args():
     )
     unused_ports_parser.add_argument(
         "--max-workers",
-        type=int,
+        type=parse_max_workers,
         default=20,
         help="Maximum number of worker threads for ping operations (default: %(default)s)",
     )
-    unused_ports_parser.set_defaults(func=handle_unused_ports_cmd)
+    unused_ports_parser.set_defaults(
+        handler_module="openstack_helper.unused_ports", handler_name="handle_unused_ports_cmd"
+    )
 
     ################
     # Images Usage #
@@ -213,7 +276,18 @@ def parse_args():
         help="Display detailed VM information (IDs and names)",
         action="store_true",
     )
-    images_usage_parser.set_defaults(func=handle_images_usage_cmd)
+    images_usage_parser.add_argument(
+        "--max-workers",
+        type=parse_max_workers,
+        default=20,
+        help=(
+            "Maximum number of worker threads for volume lookups of servers booted"
+            " from volume (default: %(default)s)"
+        ),
+    )
+    images_usage_parser.set_defaults(
+        handler_module="openstack_helper.images_usage", handler_name="handle_images_usage_cmd"
+    )
 
     ######################
     # Resource providers #
@@ -276,7 +350,19 @@ def parse_args():
             "separate them with commas"
         ),
     )
-    resource_provider_parser.set_defaults(func=handle_resource_provider_cmd)
+    resource_provider_parser.add_argument(
+        "--max-workers",
+        type=parse_max_workers,
+        default=20,
+        help=(
+            "Maximum number of worker threads for resource provider usage and inventory"
+            " lookups (default: %(default)s)"
+        ),
+    )
+    resource_provider_parser.set_defaults(
+        handler_module="openstack_helper.resource_provider",
+        handler_name="handle_resource_provider_cmd",
+    )
 
     ##############################
     # Check instance allocations #
@@ -294,7 +380,19 @@ def parse_args():
         dest="uuid",
         help="Comma-separated list of instance UUIDs to check allocation",
     )
-    check_allocations_parser.set_defaults(func=handle_check_allocations_cmd)
+    check_allocations_parser.add_argument(
+        "--max-workers",
+        type=parse_max_workers,
+        default=20,
+        help=(
+            "Maximum number of worker threads for Nova and Placement API calls"
+            " (default: %(default)s)"
+        ),
+    )
+    check_allocations_parser.set_defaults(
+        handler_module="openstack_helper.check_allocations",
+        handler_name="handle_check_allocations_cmd",
+    )
 
     ################
     # Routers info #
@@ -319,7 +417,9 @@ def parse_args():
         dest="name",
         help="Comma-separated list of routers name to show information",
     )
-    routers_info_parser.set_defaults(func=handle_routers_info_cmd)
+    routers_info_parser.set_defaults(
+        handler_module="openstack_helper.routers_info", handler_name="handle_routers_info_cmd"
+    )
 
     #########################
     # Load Balancer Flavors #
@@ -350,7 +450,19 @@ def parse_args():
     lb_flavors_parser.add_argument(
         "--detail", action="store_true", help="Display detailed information"
     )
-    lb_flavors_parser.set_defaults(func=handle_lb_flavors_cmd)
+    lb_flavors_parser.add_argument(
+        "--max-workers",
+        type=parse_max_workers,
+        default=20,
+        help=(
+            "Maximum number of worker threads for flavor profile and compute flavor"
+            " lookups (default: %(default)s)"
+        ),
+    )
+    lb_flavors_parser.set_defaults(
+        handler_module="openstack_helper.loadbalancer_flavors",
+        handler_name="handle_lb_flavors_cmd",
+    )
 
     return parser.parse_args()
 
@@ -371,9 +483,20 @@ def main():
 
     logging.debug(args)
 
-    openstack_api = OpenStackAPI(insecure=args.insecure)
+    # Subcommand handlers and the OpenStack SDK are imported only after the
+    # arguments are parsed, so '--help' and argument errors do not pay their
+    # import time, and only the selected subcommand module is loaded.
+    # pylint: disable=import-outside-toplevel
+    from openstack_helper.openstack_api import OpenStackAPI
+
+    handler = getattr(importlib.import_module(args.handler_module), args.handler_name)
+
+    # Keep one connection per worker thread, so concurrent API calls
+    # do not wait for a free connection or open throwaway ones
+    pool_size = max(args.pool_size, getattr(args, "max_workers", 0))
+    openstack_api = OpenStackAPI(insecure=args.insecure, pool_size=pool_size)
     try:
-        args.func(openstack_api, args)
+        handler(openstack_api, args)
     except ValueError as e:
         sys.exit(e)
 
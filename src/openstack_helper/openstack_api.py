@@ -9,6 +9,7 @@ By using this wrapper, we can easily manage and verify which OpenStack operation
 are available within a given OpenStack environment.
 """
 import openstack
+from keystoneauth1.session import TCPKeepAliveAdapter
 
 
 # pylint: disable=too-few-public-methods
@@ -26,16 +27,20 @@ class OpenStackAPI:
         placement (PlacementAPI): Interface to OpenStack Placement operations.
     """
 
-    def __init__(self, debug=False, insecure=False):
+    def __init__(self, debug=False, insecure=False, pool_size=None):
         """
         Initialize the OpenStackAPI instance and establish a connection.
 
         Args:
             debug (bool): Whether to enable debug logging.
             insecure (bool): If True, disable TLS certificate verification
+            pool_size (int, optional): Maximum number of HTTP connections kept
+                per host. If None, the requests default (10) is used.
         """
         openstack.enable_logging(debug=debug)
         self.os_conn = openstack.connect(insecure=insecure)
+        if pool_size:
+            self.set_connection_pool_size(pool_size)
 
         self.image = ImageAPI(self.os_conn)
         self.compute = ComputeAPI(self.os_conn)
@@ -44,6 +49,22 @@ class OpenStackAPI:
         self.network = NetworkAPI(self.os_conn)
         self.placement = PlacementAPI(self.os_conn)
 
+    def set_connection_pool_size(self, pool_size):
+        """
+        Resize the HTTP connection pool shared by all OpenStack service calls.
+
+        The default pool keeps at most 10 connections per host, so concurrent
+        API calls above that limit wait for a free connection.
+
+        Args:
+            pool_size (int): Maximum number of HTTP connections kept per host.
+        """
+        # Keep keystoneauth's TCP keep-alive adapter, only with a larger pool
+        adapter = TCPKeepAliveAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        http_session = self.os_conn.session.session
+        for scheme in list(http_session.adapters):
+            http_session.mount(scheme, adapter)
+
 
 class LoadBalanerAPI:
     """
@@ -130,6 +151,20 @@ class NetworkAPI:
         """
         return list(self.os_conn.network.routers(**filters))
 
+    def list_networks(self, **filters):
+        """
+        Retrieve a list of OpenStack networks based on the provided filters.
+
+        Args:
+            **filters: Arbitrary keyword arguments specifying filtering
+                       criteria for the OpenStack network query. Common filters
+                       'id', 'name', 'status', 'project_id', 'fields', etc.
+
+        Returns:
+            list: A list of OpenStack network objects that match the filters.
+        """
+        return list(self.os_conn.network.networks(**filters))
+
     def find_network(self, name_or_id, ignore_missing=True):
         """
         Retrieve an OpenStack network.
@@ -307,11 +342,14 @@ class PlacementAPI:
         """
         Retrieve all resource providers.
 
+        Resource providers are retrieved lazily, page by page, as the result
+        is iterated.
+
         Args:
             **filters: Arbitrary keyword arguments to filter resource providers.
 
         Returns:
-            list: A list of resource providers.
+            generator: A generator of resource providers.
         """
         return self.os_conn.placement.resource_providers(**filters)
 
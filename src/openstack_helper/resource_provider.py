@@ -2,13 +2,17 @@
 """
 openstack-helper - resource provider command
 """
+import concurrent.futures
 import logging
+import sys
 from dataclasses import dataclass, field, fields
+from operator import attrgetter
 
-from openstack_helper.common import RICH_AVAILABLE, Console, Table
+from openstack_helper import common
+from openstack_helper.common import DATACLASS_SLOTS, RICH_AVAILABLE
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 # pylint: disable=too-many-instance-attributes
 class ResourceProviderInfo:
     """
@@ -79,15 +83,75 @@ class ResourceProviderInfo:
             self.current_allocation_ratio = 0.0
 
 
-def get_resource_providers_info(openstack_api, resource_classes=None, filters=None):
+def get_provider_info(openstack_api, provider, resource_classes=None):
+    """
+    Retrieve the inventory and usage information of a single resource provider.
+
+    Args:
+        openstack_api (OpenStackAPI): Instance of OpenStackAPI.
+        provider (ResourceProvider): The resource provider to retrieve information for.
+        resource_classes (list): List of resource classes to include. If None, include all.
+
+    Returns:
+        List[ResourceProviderInfo]: One instance per resource class of the provider.
+    """
+    logging.debug("Processing resource provider: %s", provider.name)
+
+    usage = openstack_api.placement.retrieve_provider_usage(provider)
+    logging.debug("Usage for provider %s: %s", provider.name, usage)
+
+    # Placement reports usage for every resource class in the provider inventory,
+    # so a provider without any selected class has no inventory to retrieve
+    if resource_classes and usage is not None and usage.keys().isdisjoint(resource_classes):
+        logging.debug(
+            "Skipping resource provider %s (no selected resource class)", provider.name
+        )
+        return []
+
+    provider_info_list = []
+
+    logging.debug("Retrieving resource provider inventories: %s", provider.name)
+    inventories = openstack_api.placement.retrieve_resource_provider_inventories(provider)
+    for inventory in inventories:
+        logging.debug("Provider inventory: %s", inventory)
+
+        # If filters are provided, skip classes not in the list
+        if resource_classes and inventory.resource_class not in resource_classes:
+            logging.debug(
+                "Skipping resource class '%s' (not in user selection)",
+                inventory.resource_class,
+            )
+            continue
+
+        provider_info = ResourceProviderInfo(
+            provider_name=provider.name,
+            resource_class=inventory.resource_class,
+            allocation_ratio=inventory.allocation_ratio,
+            total=inventory.total,
+            reserved=inventory.reserved,
+            usage=usage.get(inventory.resource_class, 0),
+        )
+        provider_info_list.append(provider_info)
+
+    return provider_info_list
+
+
+def get_resource_providers_info(
+    openstack_api, resource_classes=None, filters=None, max_workers=20
+):
     """
     Retrieve resource provider information and return it as a list of
     ResourceProviderInfo instances.
 
+    The usage and inventories of each resource provider are retrieved
+    concurrently using a thread pool.
+
     Args:
         openstack_api (OpenStackAPI): Instance of OpenStackAPI.
         resource_classes (list): List of resource classes to include. If None, include all.
         filters (dict): Dictionary of filters to apply when retrieving resource providers.
+        max_workers (int): Maximum number of worker threads for concurrent API calls.
+                           Defaults to 20.
 
     Returns:
         List[ResourceProviderInfo]: List of resource provider information instances.
@@ -96,39 +160,55 @@ def get_resource_providers_info(openstack_api, resource_classes=None, filters=No
 
     logging.debug("Retrieving resource providers with filters: %s", filters)
 
-    for provider in openstack_api.placement.retrieve_resource_providers(**filters):
-        logging.debug("Processing resource provider: %s", provider.name)
-
-        usage = openstack_api.placement.retrieve_provider_usage(provider)
-        logging.debug("Usage for provider %s: %s", provider.name, usage)
-
-        logging.debug("Retrieving resource provider inventories: %s", provider.name)
-        inventories = openstack_api.placement.retrieve_resource_provider_inventories(provider)
-        for inventory in inventories:
-            logging.debug("Provider inventory: %s", inventory)
-
-            # If filters are provided, skip classes not in the list
-            if resource_classes and inventory.resource_class not in resource_classes:
-                logging.debug(
-                    "Skipping resource class '%s' (not in user selection)",
-                    inventory.resource_class,
-                )
-                continue
-
-            provider_info = ResourceProviderInfo(
-                provider_name=provider.name,
-                resource_class=inventory.resource_class,
-                allocation_ratio=inventory.allocation_ratio,
-                total=inventory.total,
-                reserved=inventory.reserved,
-                usage=usage.get(inventory.resource_class, 0),
-            )
-            resource_providers_info.append(provider_info)
+    # The providers listing is paginated. executor.map submits each provider as soon
+    # as its page is received, so the lookups overlap with fetching the next pages.
+    providers = openstack_api.placement.retrieve_resource_providers(**(filters or {}))
+    logging.debug("Using up to %s threads", max_workers)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for provider_info_list in executor.map(
+            lambda provider: get_provider_info(openstack_api, provider, resource_classes),
+            providers,
+        ):
+            resource_providers_info.extend(provider_info_list)
 
     logging.debug("Collected details for %d resource providers", len(resource_providers_info))
     return resource_providers_info
 
 
+def get_column_specs(dataclass_type, formatters):
+    """
+    Build the display specification of each column from the dataclass fields.
+
+    Args:
+        dataclass_type (dataclass): The dataclass type whose fields are the columns.
+        formatters (dict): Functions that format a field value into a string,
+            keyed by field name. Fields not listed are formatted with str.
+
+    Returns:
+        Tuple[Tuple[str, str, dict, callable], ...]: The field name, display name,
+            Rich column style and value formatter of each column.
+    """
+    return tuple(
+        (
+            field_obj.name,
+            field_obj.metadata.get("display_name", field_obj.name.replace("_", " ").title()),
+            field_obj.metadata.get("style", {}),
+            formatters.get(field_obj.name, str),
+        )
+        for field_obj in fields(dataclass_type)
+    )
+
+
+RESOURCE_PROVIDER_COLUMNS = get_column_specs(
+    ResourceProviderInfo,
+    {
+        "allocation_ratio_pct": "{:.2f}%".format,
+        "current_allocation_ratio": "{:.2f}".format,
+    },
+)
+
+
 def display_resource_providers_info(resource_providers_info):
     """
     Display resource providers information.
@@ -142,55 +222,41 @@ def display_resource_providers_info(resource_providers_info):
         resource_providers_info (List[ResourceProviderInfo]): List of resource provider
             information instances.
     """
-    # Get field objects from the dataclass
-    dataclass_fields = fields(ResourceProviderInfo)
-    logging.debug("dataclass_fields: %s", dataclass_fields)
+    logging.debug("Columns: %s", RESOURCE_PROVIDER_COLUMNS)
 
     # Prepare rows for the table
-    rows = []
-    for resource in resource_providers_info:
-        row = []
-        for field_obj in dataclass_fields:
-            value = getattr(resource, field_obj.name)
-            # Format fields
-            if field_obj.name == "allocation_ratio_pct":
-                value = f"{value:.2f}%"
-            if field_obj.name == "current_allocation_ratio":
-                value = f"{value:.2f}"
-            row.append(str(value))
-        rows.append(row)
+    rows = [
+        [
+            formatter(getattr(resource, name))
+            for name, _, _, formatter in RESOURCE_PROVIDER_COLUMNS
+        ]
+        for resource in resource_providers_info
+    ]
 
     if RICH_AVAILABLE:
-        console = Console()
-        table = Table(show_header=True, header_style="bold magenta")
+        console = common.Console()
+        table = common.Table(show_header=True, header_style="bold magenta")
 
         # Build table columns using field metadata
-        for field_obj in dataclass_fields:
-            display_name = field_obj.metadata.get(
-                "display_name", field_obj.name.replace("_", " ").title()
-            )
-            style = field_obj.metadata.get("style", {})
+        for _, display_name, style, _ in RESOURCE_PROVIDER_COLUMNS:
             table.add_column(display_name, **style)
         for row in rows:
             table.add_row(*row)
 
         console.print(table)
     else:
-        headers = []
-        for field_obj in dataclass_fields:
-            display_name = field_obj.metadata.get(
-                "display_name", field_obj.name.replace("_", " ").title()
-            )
-            headers.append(display_name)
-        print("\t".join(headers))
-        for row in rows:
-            print("\t".join(row))
+        # Fallback tab-separated output, written at once
+        lines = [
+            "\t".join(display_name for _, display_name, _, _ in RESOURCE_PROVIDER_COLUMNS)
+        ]
+        lines.extend("\t".join(row) for row in rows)
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def sort_resource_providers_info(resource_providers_info, sort_by_columns):
     """
-    Sorts a list of ResourceProviderInfo instances based on specified display
-    name columns.
+    Sorts a list of ResourceProviderInfo instances in place based on specified
+    display name columns.
 
     Args:
         resource_providers_info (List[ResourceProviderInfo]):
@@ -200,26 +266,20 @@ def sort_resource_providers_info(resource_providers_info, sort_by_columns):
 
     Returns:
         List[ResourceProviderInfo]:
-            Sorted list of resource provider information instances.
+            The same list, sorted.
 
     """
 
-    # Retrieve the display names from the ResourceProviderInfo dataclass metadata
-    display_names = get_dataclass_field_metadata(ResourceProviderInfo, "display_name")
-
     # Extract the actual field names that correspond to the provided sort-by display names
-    sort_fields = []
-    for col in sort_by_columns:
-        # Find which field matches the display name `col`
-        for field_name, disp_name in display_names.items():
-            if disp_name == col:
-                sort_fields.append(field_name)
-                break
-
-    # Sort the resource providers
-    return sorted(
-        resource_providers_info, key=lambda x: [getattr(x, field) for field in sort_fields]
-    )
+    sort_fields = [
+        FIELD_NAMES_BY_DISPLAY_NAME[col]
+        for col in sort_by_columns
+        if col in FIELD_NAMES_BY_DISPLAY_NAME
+    ]
+    # Sort the resource providers in place
+    if sort_fields:
+        resource_providers_info.sort(key=attrgetter(*sort_fields))
+    return resource_providers_info
 
 
 def get_dataclass_field_metadata(dataclass_type, metadata_key):
@@ -253,6 +313,15 @@ def get_dataclass_field_metadata(dataclass_type, metadata_key):
     return metadata_values
 
 
+# Field name of each ResourceProviderInfo column, keyed by its display name
+FIELD_NAMES_BY_DISPLAY_NAME = {
+    display_name: field_name
+    for field_name, display_name in get_dataclass_field_metadata(
+        ResourceProviderInfo, "display_name"
+    ).items()
+}
+
+
 def construct_filters(args):
     """
     Constructs the filters dictionary based on user input.
@@ -285,23 +354,22 @@ def handle_resource_provider_cmd(openstack_api, args):
     Args:
         openstack_api (OpenStackAPI): Instance of OpenStackAPI.
         args (argparse.Namespace): Parsed command-line arguments.
-    """
-    # Retrieve display names from the ResourceProviderInfo dataclass metadata
-    display_names = get_dataclass_field_metadata(ResourceProviderInfo, "display_name")
-    logging.debug("display_names: %s", display_names)
 
+    Raises:
+        ValueError: If a sort-by column is invalid.
+    """
     # Identify any sort-by columns specified by the user that are not valid
-    invalid_columns = [col for col in args.sort_by if col not in display_names.values()]
+    invalid_columns = [col for col in args.sort_by if col not in FIELD_NAMES_BY_DISPLAY_NAME]
     if invalid_columns:
         print(f"Invalid sort-by column(s): {', '.join(invalid_columns)}")
-        print(f"Valid columns are: {', '.join(display_names.values())}")
+        print(f"Valid columns are: {', '.join(FIELD_NAMES_BY_DISPLAY_NAME)}")
         raise ValueError("Error: Invalid sort-by column")
 
     # Construct filters based on user input
     filters = construct_filters(args)
 
     resource_providers_info = get_resource_providers_info(
-        openstack_api, args.resource_class, filters
+        openstack_api, args.resource_class, filters, max_workers=args.max_workers
     )
 
     if not resource_providers_info:
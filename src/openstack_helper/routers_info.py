@@ -7,10 +7,17 @@ from collections import defaultdict
 from dataclasses import dataclass
 from typing import Optional
 
-from openstack_helper.common import RICH_AVAILABLE, Console, Group, Table, Text, Tree
+from openstack_helper import common
+from openstack_helper.common import DATACLASS_SLOTS, RICH_AVAILABLE
 
+# Maximum number of IDs per filtered Neutron request, to keep the URL short
+NEUTRON_IDS_CHUNK_SIZE = 100
+# Neutron fields used by this command, so Neutron returns only them
+ROUTER_FIELDS = ["id", "name", "status", "updated_at", "distributed", "external_gateway_info"]
+PORT_FIELDS = ["id", "status", "network_id", "fixed_ips", "device_id"]
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class PortInfo:
     """Class to store a Neutron port attached to a router."""
 
@@ -20,7 +27,7 @@ class PortInfo:
     fixed_ips: list[dict]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RouterInfo:
     """Aggregated, display-oriented router structure."""
 
@@ -46,7 +53,7 @@ def render_ports(ports, network_map):
         Returns a dimmed "-" when there are no ports.
     """
     if not ports:
-        return Text("-", style="dim")
+        return common.Text("-", style="dim")
 
     ports_by_net = defaultdict(list)
     for port in ports:
@@ -55,15 +62,15 @@ def render_ports(ports, network_map):
     network_trees = []
     for net_id, net_ports in ports_by_net.items():
         network_name = network_map.get(net_id, "Unknown Network")
-        network_header = Text.assemble(
+        network_header = common.Text.assemble(
             ("Network: ", "bold"),
             (net_id or "N/A", "magenta"),
             (f" ({network_name})", "dim magenta"),
         )
-        tree = Tree(network_header)
+        tree = common.Tree(network_header)
 
         for port in net_ports:
-            port_label = Text.assemble(
+            port_label = common.Text.assemble(
                 ("Port: ", "bold"),
                 (port.id, "cyan"),
                 (" (", "dim"),
@@ -72,7 +79,7 @@ def render_ports(ports, network_map):
             )
             port_branch = tree.add(port_label)
             for ip_info in port.fixed_ips:
-                ip_label = Text.assemble(
+                ip_label = common.Text.assemble(
                     ("IP: ", "bold"),
                     (ip_info.get("ip_address", "N/A"), "bright_green"),
                     (" | Subnet: ", "dim"),
@@ -81,7 +88,7 @@ def render_ports(ports, network_map):
                 port_branch.add(ip_label)
         network_trees.append(tree)
 
-    return Group(*network_trees)
+    return common.Group(*network_trees)
 
 
 def render_gateway_info(gw_info, network_map):
@@ -97,20 +104,20 @@ def render_gateway_info(gw_info, network_map):
         a dimmed "-" when no gateway is present.
     """
     if not gw_info:
-        return Text("-")
+        return common.Text("-")
 
     network_id = gw_info.get("network_id", "")
     network_name = network_map.get(network_id, "Unknown Network")
     enable_snat = gw_info.get("enable_snat")
     ext_fixed_ips = gw_info.get("external_fixed_ips", [])
 
-    header = Text.assemble(
+    header = common.Text.assemble(
         ("network_id: ", "bold"),
         (network_id, "magenta"),
         (f" ({network_name})", "dim magenta"),
     )
-    snat_label = Text("True", "green") if enable_snat else Text("False", "red")
-    snat_line = Text.assemble(("enable_snat: ", "bold"), snat_label)
+    snat_label = common.Text("True", "green") if enable_snat else common.Text("False", "red")
+    snat_line = common.Text.assemble(("enable_snat: ", "bold"), snat_label)
 
     if ext_fixed_ips:
         ip_lines = []
@@ -119,42 +126,65 @@ def render_gateway_info(gw_info, network_map):
             subnet_id = ip_info.get("subnet_id", "N/A")
 
             ip_lines.append(
-                Text.assemble(("  - ip_address: ", "default"), (ip_address, "green"))
+                common.Text.assemble(("  - ip_address: ", "default"), (ip_address, "green"))
             )
             ip_lines.append(
-                Text.assemble(("    subnet_id: ", "default"), (subnet_id, "yellow"))
+                common.Text.assemble(("    subnet_id: ", "default"), (subnet_id, "yellow"))
             )
 
-        ip_addr_renderable = Group(Text("external_fixed_ips:", style="bold"), *ip_lines)
+        ip_addr_renderable = common.Group(
+            common.Text("external_fixed_ips:", style="bold"), *ip_lines
+        )
     else:
-        ip_addr_renderable = Text.assemble(("external_fixed_ips: ", "bold"), ("-", "dim"))
+        ip_addr_renderable = common.Text.assemble(
+            ("external_fixed_ips: ", "bold"), ("-", "dim")
+        )
 
-    return Group(header, snat_line, ip_addr_renderable)
+    return common.Group(header, snat_line, ip_addr_renderable)
 
 
-def _get_ports_for_router(openstack_api, router_id):
+def _chunked(ids):
     """
-    Fetch ports for a router and structure them as PortInfo objects.
+    Split IDs in lists of at most NEUTRON_IDS_CHUNK_SIZE items.
+
+    Args:
+        ids: Sequence of IDs.
+
+    Yields:
+        Lists of consecutive IDs.
+    """
+    for start in range(0, len(ids), NEUTRON_IDS_CHUNK_SIZE):
+        end = start + NEUTRON_IDS_CHUNK_SIZE
+        yield list(ids[start:end])
+
+
+def _get_ports_for_routers(openstack_api, router_ids):
+    """
+    Fetch the ports of several routers and structure them as PortInfo objects.
+
+    Ports are retrieved with one Neutron request per chunk of
+    NEUTRON_IDS_CHUNK_SIZE routers, instead of one request per router.
 
     Args:
         openstack_api (OpenStackAPI): Instance of OpenStackAPI.
-        router_id: The router UUID whose ports should be retrieved.
+        router_ids: The router UUIDs whose ports should be retrieved.
 
     Returns:
-        List of PortInfo derived from the SDK port resources.
+        Dict mapping each router UUID to its list of PortInfo.
     """
-    ports_info = []
-    query_params = {"device_id": router_id}
-    for port in openstack_api.network.retrieve_ports(**query_params):
-        ports_info.append(
-            PortInfo(
-                id=port.id,
-                status=port.status or "N/A",
-                network_id=port.network_id or "",
-                fixed_ips=port.fixed_ips or [],
+    ports_by_router = defaultdict(list)
+    for router_ids_chunk in _chunked(router_ids):
+        query_params = {"device_id": router_ids_chunk, "fields": PORT_FIELDS}
+        for port in openstack_api.network.retrieve_ports(**query_params):
+            ports_by_router[port.device_id].append(
+                PortInfo(
+                    id=port.id,
+                    status=port.status or "N/A",
+                    network_id=port.network_id or "",
+                    fixed_ips=port.fixed_ips or [],
+                )
             )
-        )
-    return ports_info
+    return ports_by_router
 
 
 def get_all_router_data(openstack_api, router_ids, router_names):
@@ -178,21 +208,27 @@ def get_all_router_data(openstack_api, router_ids, router_names):
     routers_info = []
     all_network_ids = set()
 
-    query_params = {}
+    query_params = {"fields": ROUTER_FIELDS}
     if router_ids:
         query_params["id"] = router_ids
     if router_names:
         query_params["name"] = router_names
     logging.debug("Getting routers with filter: %s", query_params)
 
-    for router in openstack_api.network.list_routers(**query_params):
+    routers = openstack_api.network.list_routers(**query_params)
+    if not routers:
+        return routers_info, all_network_ids
+
+    ports_by_router = _get_ports_for_routers(openstack_api, [router.id for router in routers])
+
+    for router in routers:
         gateway_info = router.external_gateway_info or None
         if gateway_info:
             network_id = gateway_info.get("network_id", None)
             if network_id:
                 all_network_ids.add(network_id)
 
-        ports = _get_ports_for_router(openstack_api, router.id)
+        ports = ports_by_router.get(router.id, [])
         for port in ports:
             if port.network_id:
                 all_network_ids.add(port.network_id)
@@ -211,6 +247,29 @@ def get_all_router_data(openstack_api, router_ids, router_names):
     return routers_info, all_network_ids
 
 
+def get_network_names(openstack_api, network_ids):
+    """
+    Retrieve the names of several networks.
+
+    Networks are retrieved with one Neutron request per chunk of
+    NEUTRON_IDS_CHUNK_SIZE networks, instead of one request per network.
+
+    Args:
+        openstack_api (OpenStackAPI): Instance of OpenStackAPI.
+        network_ids: The network UUIDs whose names should be retrieved.
+
+    Returns:
+        Dict mapping network UUIDs to their names. Networks not found are left out.
+    """
+    network_map = {}
+    for network_ids_chunk in _chunked(sorted(network_ids)):
+        for network in openstack_api.network.list_networks(
+            id=network_ids_chunk, fields=["id", "name"]
+        ):
+            network_map[network.id] = network.name
+    return network_map
+
+
 def handle_routers_info_cmd(openstack_api, args):
     """
     Handle the 'routers_info' subcommand.
@@ -228,7 +287,7 @@ def handle_routers_info_cmd(openstack_api, args):
         print("Install Rich library to use this command")
         return
 
-    console = Console()
+    console = common.Console()
     with console.status("[bold green]Fetching router information..."):
         all_routers, all_network_ids = get_all_router_data(
             openstack_api, router_ids, router_names
@@ -241,11 +300,9 @@ def handle_routers_info_cmd(openstack_api, args):
     network_map = {}
     if all_network_ids:
         with console.status("[bold green]Fetching network information..."):
-            for network_id in all_network_ids:
-                network = openstack_api.network.find_network(network_id)
-                network_map[network_id] = network.name
+            network_map = get_network_names(openstack_api, all_network_ids)
 
-    table = Table(show_header=True, padding=(0, 0), show_lines=True)
+    table = common.Table(show_header=True, padding=(0, 0), show_lines=True)
     table.add_column("ID", style="cyan", no_wrap=True)
     table.add_column("Name", style="magenta")
     table.add_column("Status", style="green")
@@ -256,9 +313,11 @@ def handle_routers_info_cmd(openstack_api, args):
 
     for router in all_routers:
         is_dist_label = (
-            Text("True", "green") if router.is_distributed else Text("False", "red")
+            common.Text("True", "green")
+            if router.is_distributed
+            else common.Text("False", "red")
         )
-        router_status_label = Text(
+        router_status_label = common.Text(
             router.status, style="green" if router.status == "ACTIVE" else "red"
         )
 
@@ -2,27 +2,23 @@
 """
 openstack-helper - unused_ports command
 """
-import concurrent.futures
 import logging
+import sys
+from operator import attrgetter
 
-from openstack_helper.common import ping_ip_address
+from openstack_helper import common
+from openstack_helper.common import RICH_AVAILABLE, ping_ip_addresses
 
-try:
-    from rich.console import Console
-    from rich.tree import Tree
 
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
-
-
-def ping_port_ip_addresses(port):
+def ping_port_ip_addresses(port, reachable_ips=None):
     """
     Check if any IP address associated with the port is reachable via ping.
 
     Args:
         port (Port): The OpenStack Port object containing a list of fixed IPs
             (port.fixed_ips).
+        reachable_ips (set, optional): IP addresses already known to be reachable,
+            as returned by ping_ip_addresses. If None, the port IP addresses are pinged.
 
     Returns:
         bool: True if any of the IPs are reachable, False otherwise.
@@ -33,13 +29,18 @@ def ping_port_ip_addresses(port):
         logging.debug("No IP addresses found to ping; skipping ping check")
         return False
 
+    if reachable_ips is None:
+        reachable_ips = ping_ip_addresses(ip_addr_list)
+
+    is_reachable = False
     for ip in ip_addr_list:
-        if ping_ip_address(ip):
+        if ip in reachable_ips:
             logging.info("Ping succeeded for IP address: %s", ip)
-            return True
-        logging.info("Ping failed for IP address: %s", ip)
+            is_reachable = True
+        else:
+            logging.info("Ping failed for IP address: %s", ip)
 
-    return False
+    return is_reachable
 
 
 def filter_ports_by_ping(eligible_ports, max_workers):
@@ -47,9 +48,13 @@ def filter_ports_by_ping(eligible_ports, max_workers):
     Perform ping checks on eligible ports and remove ports whose IP addresses
     are reachable via ping.
 
+    The IP addresses of all ports are pinged together in a single batch, so the
+    check takes about one ping timeout regardless of the number of ports.
+
     Args:
         eligible_ports (list): Ports to check for reachability.
-        max_workers (int): Maximum number of worker threads for concurrent ping operations.
+        max_workers (int): Maximum number of worker threads for concurrent ping
+            operations, used when fping is not available.
 
     Returns:
         list: Ports whose IP addresses are not reachable via ping.
@@ -58,28 +63,46 @@ def filter_ports_by_ping(eligible_ports, max_workers):
         logging.debug("No eligible ports to ping")
         return []
 
-    logging.debug("Starting concurrent ping checks on eligible ports")
-
-    num_workers = min(max_workers, len(eligible_ports))
-    logging.debug("Using %s threads", num_workers)
+    # Ping each IP address once, even if it appears on more than one port
+    ip_addresses = list(
+        dict.fromkeys(ip["ip_address"] for port in eligible_ports for ip in port.fixed_ips)
+    )
+    logging.debug("Starting ping checks on %s IP addresses", len(ip_addresses))
+    reachable_ips = ping_ip_addresses(ip_addresses, max_workers=max_workers)
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as executor:
-        future_to_port = {
-            executor.submit(ping_port_ip_addresses, port): port for port in eligible_ports
-        }
+    # Collect ports that remain eligible after ping checks
+    return [port for port in eligible_ports if not ping_port_ip_addresses(port, reachable_ips)]
 
-        # Collect ports that remain eligible after ping checks
-        final_eligible_ports = []
-        for future in concurrent.futures.as_completed(future_to_port):
-            port = future_to_port[future]
-            try:
-                is_port_ip_reachable = future.result()
-                if not is_port_ip_reachable:
-                    final_eligible_ports.append(port)
-            except concurrent.futures.TimeoutError as e:
-                logging.error("Error processing port %s: %s", port.id, e)
 
-    return final_eligible_ports
+# Checks a port must pass to be eligible for deletion. Each check is a
+# (description, port attribute shown in the debug log, check function) tuple
+PORT_ELIGIBILITY_CHECKS = (
+    (
+        "Port status is DOWN",
+        "status",
+        lambda port, device_owner: port.status.upper() == "DOWN",
+    ),
+    (
+        "Port has no binding_host_id",
+        "binding_host_id",
+        lambda port, device_owner: not port.binding_host_id,
+    ),
+    (
+        "Port has no binding_vif_details",
+        "binding_vif_details",
+        lambda port, device_owner: not port.binding_vif_details,
+    ),
+    (
+        "Port binding_vif_type is 'unbound'",
+        "binding_vif_type",
+        lambda port, device_owner: port.binding_vif_type == "unbound",
+    ),
+    (
+        "Port device_owner matches expected",
+        "device_owner",
+        lambda port, device_owner: port.device_owner == device_owner,
+    ),
+)
 
 
 def is_port_eligible(port, device_owner):
@@ -87,6 +110,8 @@ def is_port_eligible(port, device_owner):
     Check if a port is eligible for deletion based on status,
     binding details, and device owner.
 
+    Unless debug logging is enabled, checking stops at the first failed check.
+
     Args:
         port (Port): An OpenStack port object to evaluate.
         device_owner (str): Expected device owner to filter ports.
@@ -94,36 +119,20 @@ def is_port_eligible(port, device_owner):
     Returns:
         bool: True if the port is eligible for deletion, False otherwise.
     """
-    checks = [
-        (port.status.upper() == "DOWN", f"Port status is DOWN. Value: '{port.status}'"),
-        (
-            not port.binding_host_id,
-            f"Port has no binding_host_id. Value: '{port.binding_host_id}'",
-        ),
-        (
-            not port.binding_vif_details,
-            f"Port has no binding_vif_details. Value: '{port.binding_vif_details}'",
-        ),
-        (
-            port.binding_vif_type == "unbound",
-            f"Port binding_vif_type is 'unbound'. Value: '{port.binding_vif_type}'",
-        ),
-        (
-            port.device_owner == device_owner,
-            f"Port device_owner matches expected. Value: '{port.device_owner}'",
-        ),
-    ]
+    if not logging.getLogger().isEnabledFor(logging.DEBUG):
+        return all(check(port, device_owner) for _, _, check in PORT_ELIGIBILITY_CHECKS)
 
     is_eligible = True
 
     logging.debug("#####################################################")
     logging.debug("### Checking port: %s (%s)", port.id, port.name)
 
-    for condition, message in checks:
-        if condition:
-            logging.debug("Check Passed: %s", message)
+    # Run all checks, so the debug log shows every reason a port is not eligible
+    for message, attr, check in PORT_ELIGIBILITY_CHECKS:
+        if check(port, device_owner):
+            logging.debug("Check Passed: %s. Value: '%s'", message, getattr(port, attr))
         else:
-            logging.debug("Check Failed: %s", message)
+            logging.debug("Check Failed: %s. Value: '%s'", message, getattr(port, attr))
             is_eligible = False
 
     if is_eligible:
@@ -157,6 +166,24 @@ def filter_unused_ports(ports, device_owner, ping=False, max_workers=20):
     return eligible_ports
 
 
+# Port attributes shown for each port eligible for deletion, and their labels
+PORT_DISPLAY_ATTRIBUTES = (
+    "id",
+    "name",
+    "description",
+    "status",
+    "binding_host_id",
+    "binding_vif_details",
+    "binding_vif_type",
+    "device_owner",
+    "dns_assignment",
+    "fixed_ips",
+    "updated_at",
+)
+PORT_DISPLAY_LABELS = tuple(attr.replace("_", " ").title() for attr in PORT_DISPLAY_ATTRIBUTES)
+get_port_display_values = attrgetter(*PORT_DISPLAY_ATTRIBUTES)
+
+
 def show_unused_ports(eligible_ports):
     """
     Display the details of OpenStack ports that are eligible for deletion.
@@ -174,39 +201,27 @@ def show_unused_ports(eligible_ports):
     Returns:
         None: The function prints the output directly to stdout.
     """
-    port_attributes = [
-        "id",
-        "name",
-        "description",
-        "status",
-        "binding_host_id",
-        "binding_vif_details",
-        "binding_vif_type",
-        "device_owner",
-        "dns_assignment",
-        "fixed_ips",
-        "updated_at",
-    ]
-
     if RICH_AVAILABLE:
-        console = Console()
-        tree = Tree("Ports Eligible for Deletion")
+        console = common.Console()
+        tree = common.Tree("Ports Eligible for Deletion")
 
         for port in eligible_ports:
             port_id = f"[bold cyan]{port.id}[/bold cyan]"
             port_tree = tree.add(port_id)
-            for attr in port_attributes:
-                value = getattr(port, attr, "")
-                attr_name = attr.replace("_", " ").title()
-                port_tree.add(f"[green]{attr_name}[/green]: {value}")
+            for label, value in zip(PORT_DISPLAY_LABELS, get_port_display_values(port)):
+                port_tree.add(f"[green]{label}[/green]: {value}")
 
         console.print(tree)
     else:
+        # Fallback plain text output, written at once
+        lines = []
         for port in eligible_ports:
-            print(f"-- {port.id}")
-            for attr in port_attributes:
-                value = getattr(port, attr, None)
-                print(f"   |-- {attr}: {value}")
+            lines.append(f"-- {port.id}")
+            lines.extend(
+                f"   |-- {attr}: {value}"
+                for attr, value in zip(PORT_DISPLAY_ATTRIBUTES, get_port_display_values(port))
+            )
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def handle_unused_ports_cmd(openstack_api, args):
@@ -216,13 +231,7 @@ def handle_unused_ports_cmd(openstack_api, args):
     Args:
         openstack_api (OpenStackAPI): Instance of OpenStackAPI.
         args (argparse.Namespace): Parsed command-line arguments.
-
-    Raises:
-        ValueError: If --max-workers is set to a value outside the range 1-100.
     """
-    if args.max_workers < 1 or args.max_workers > 100:
-        raise ValueError("Invalid value for --max-workers. It must be between 1 and 100.")
-
     # Prepare the query parameters
     query_params = {
         "device_owner": args.device_owner,
@@ -0,0 +1,24 @@
+# conftest.py
+
+"""Shared fixtures for the unit tests."""
+
+import pytest
+
+from tests.port_cases import MockPort
+
+
+@pytest.fixture(name="eligible_port")
+def eligible_port_fixture():
+    """
+    Port that passes all the eligibility checks for the 'some_device_owner'
+    device owner. Use dataclasses.replace to derive other ports from it.
+    """
+    return MockPort(
+        id="port1",
+        name="Test Port 1",
+        status="DOWN",
+        binding_host_id=None,
+        binding_vif_details=None,
+        binding_vif_type="unbound",
+        device_owner="some_device_owner",
+    )
@@ -0,0 +1,38 @@
+# port_cases.py
+
+"""Mock ports and port eligibility cases shared by the unused_ports tests."""
+
+from dataclasses import dataclass
+
+import pytest
+
+from openstack_helper.common import DATACLASS_SLOTS
+
+
+@dataclass(**DATACLASS_SLOTS)
+class MockPort:
+    """A mock Port class."""
+
+    id: str
+    name: str
+    status: str
+    binding_host_id: str
+    binding_vif_details: dict
+    binding_vif_type: str
+    device_owner: str
+
+
+# Overrides of the eligible_port fixture attributes, and whether the
+# resulting port is still eligible. Each override breaks a single check.
+PORT_ELIGIBILITY_CASES = [
+    pytest.param({}, True, id="all_checks_pass"),
+    pytest.param({"status": "ACTIVE"}, False, id="status_not_down"),
+    pytest.param({"binding_host_id": "some_host_id"}, False, id="binding_host_id_set"),
+    pytest.param(
+        {"binding_vif_details": {"some": "details"}}, False, id="binding_vif_details_set"
+    ),
+    pytest.param({"binding_vif_type": "ovs"}, False, id="binding_vif_type_not_unbound"),
+    pytest.param(
+        {"device_owner": "different_device_owner"}, False, id="device_owner_mismatch"
+    ),
+]
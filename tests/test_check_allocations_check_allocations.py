@@ -0,0 +1,85 @@
+# test_check_allocations_check_allocations.py
+
+"""Unit tests for the check_allocations function."""
+
+from unittest.mock import Mock, patch
+
+import openstack
+
+from openstack_helper.check_allocations import VmAlloc, check_allocations
+
+
+def fake_get_vm_allocation(_openstack_api, vm_uuid):
+    return VmAlloc(
+        vm_id=vm_uuid,
+        vm_name=None,
+        nova_compute_host=None,
+        nova_hypervisor_hostname=None,
+        placement_alloc={},
+    )
+
+
+def fake_find_resource_provider(rp_id, ignore_missing=True):
+    if rp_id != "rp1":
+        raise openstack.exceptions.NotFoundException()
+    rp = Mock(id=rp_id)
+    rp.name = "host1"
+    return rp
+
+
+def test_check_allocations_preserves_input_order():
+    """Results must follow the order of the input UUIDs"""
+    vm_uuids = [f"vm{i}" for i in range(10)]
+    openstack_api = Mock()
+    with patch(
+        "openstack_helper.check_allocations.get_vm_allocation",
+        side_effect=fake_get_vm_allocation,
+    ) as mock_get:
+        results = check_allocations(openstack_api, vm_uuids, max_workers=4)
+
+    assert [result.vm_id for result in results] == vm_uuids
+    assert mock_get.call_count == len(vm_uuids)
+
+
+def test_check_allocations_no_uuids():
+    """Test no instances to process"""
+    with patch("openstack_helper.check_allocations.get_vm_allocation") as mock_get:
+        assert not check_allocations(None, [], max_workers=4)
+        mock_get.assert_not_called()
+
+
+def test_check_allocations_resolves_each_resource_provider_once():
+    """Only the resource providers in the allocations are resolved, each one once"""
+    openstack_api = Mock()
+    openstack_api.placement.find_resource_provider.side_effect = fake_find_resource_provider
+    openstack_api.placement.retrieve_provider_allocations_for_instance.return_value = {
+        "rp1": {"resources": {"VCPU": 1}},
+        "rp2": {"resources": {"MEMORY_MB": 512}},
+    }
+    openstack_api.compute.find_server.return_value = Mock(
+        id="vm1", compute_host="host1", hypervisor_hostname="host1"
+    )
+
+    results = check_allocations(openstack_api, ["vm1", "vm2", "vm3"], max_workers=2)
+
+    assert sorted(
+        call.args[0] for call in openstack_api.placement.find_resource_provider.call_args_list
+    ) == ["rp1", "rp2"]
+    openstack_api.placement.resource_providers.assert_not_called()
+    # Providers not found fallback to their IDs
+    for result in results:
+        assert result.placement_alloc == {"host1": {"VCPU": 1}, "rp2": {"MEMORY_MB": 512}}
+
+
+def test_check_allocations_no_resource_providers():
+    """Instances without allocations do not trigger resource provider lookups"""
+    openstack_api = Mock()
+    openstack_api.placement.retrieve_provider_allocations_for_instance.return_value = {}
+    openstack_api.compute.find_server.return_value = Mock(
+        id="vm1", compute_host="host1", hypervisor_hostname="host1"
+    )
+
+    results = check_allocations(openstack_api, ["vm1"], max_workers=2)
+
+    openstack_api.placement.find_resource_provider.assert_not_called()
+    assert results[0].placement_alloc == {}
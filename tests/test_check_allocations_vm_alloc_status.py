@@ -0,0 +1,39 @@
+# test_check_allocations_vm_alloc_status.py
+
+"""Unit tests for the VmAlloc status property."""
+
+import pytest
+
+from openstack_helper.check_allocations import VmAlloc
+
+
+@pytest.mark.parametrize(
+    "vm_name, compute_host, hypervisor_hostname, placement_alloc, expected_status",
+    [
+        # Nova and Placement are consistent
+        ("vm", "host1", "host1", {"host1": {"VCPU": 1}}, "OK"),
+        # No data in Nova nor in Placement
+        (None, None, None, {}, "OK"),
+        # Instance missing in Nova but with Placement allocation
+        (None, None, None, {"host1": {"VCPU": 1}}, "Not OK"),
+        # Compute host and hypervisor hostname mismatch
+        ("vm", "host1", "host2", {"host1": {"VCPU": 1}}, "Not OK"),
+        # Placement allocation in a different host
+        ("vm", "host1", "host1", {"host2": {"VCPU": 1}}, "Not OK"),
+        # Placement allocation in more than one host
+        ("vm", "host1", "host1", {"host1": {}, "host2": {}}, "Not OK"),
+        # Instance in Nova without Placement allocation
+        ("vm", "host1", "host1", {}, "Not OK"),
+    ],
+)
+def test_vm_alloc_status(
+    vm_name, compute_host, hypervisor_hostname, placement_alloc, expected_status
+):
+    vm_alloc = VmAlloc(
+        vm_id="vm_id",
+        vm_name=vm_name,
+        nova_compute_host=compute_host,
+        nova_hypervisor_hostname=hypervisor_hostname,
+        placement_alloc=placement_alloc,
+    )
+    assert vm_alloc.status == expected_status
@@ -0,0 +1,39 @@
+# test_common_is_valid_uuid.py
+
+"""Unit tests for the common is_valid_uuid function."""
+
+import uuid
+
+import pytest
+
+from openstack_helper.common import is_valid_uuid
+
+
+@pytest.mark.parametrize(
+    "uuid_str",
+    [
+        "123e4567-e89b-12d3-a456-426614174000",
+        "00000000-0000-0000-0000-000000000000",
+        "FFFFFFFF-FFFF-FFFF-FFFF-FFFFFFFFFFFF",
+        uuid.UUID("123e4567-e89b-12d3-a456-426614174000"),
+    ],
+)
+def test_is_valid_uuid_valid(uuid_str):
+    assert is_valid_uuid(uuid_str) is True
+
+
+@pytest.mark.parametrize(
+    "uuid_str",
+    [
+        "invalid-uuid",
+        "123e4567e89b12d3a456426614174000",
+        "123e4567-e89b-12d3-a456-42661417400Z",
+        "{123e4567-e89b-12d3-a456-426614174000}",
+        "123e4567-e89b-12d3-a456-426614174000\n",
+        "192.168.1.1",
+        "",
+        None,
+    ],
+)
+def test_is_valid_uuid_invalid(uuid_str):
+    assert is_valid_uuid(uuid_str) is False
@@ -0,0 +1,70 @@
+# test_common_ping_ip_addresses.py
+
+"""Unit tests for the common ping_ip_addresses function."""
+
+import subprocess
+from unittest.mock import Mock, patch
+
+import pytest
+
+from openstack_helper.common import ping_ip_addresses
+
+
+def test_ping_ip_addresses_fping():
+    """Test that all IPs are pinged by a single fping command"""
+    ips = ["192.168.1.1", "192.168.1.2", "192.168.1.3"]
+    with patch("openstack_helper.common.shutil.which", return_value="/usr/bin/fping"), patch(
+        "openstack_helper.common.subprocess.run"
+    ) as mock_run:
+        mock_run.return_value = Mock(returncode=1, stdout="192.168.1.1\n192.168.1.3\n")
+        assert ping_ip_addresses(ips) == {"192.168.1.1", "192.168.1.3"}
+        mock_run.assert_called_once_with(
+            ["/usr/bin/fping", "-a", "-q", "-r", "0", "-t", "1000", *ips],
+            shell=False,
+            check=False,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+
+
+def test_ping_ip_addresses_without_fping():
+    """Test that it falls back to ping each IP when fping is not installed"""
+    ips = ["192.168.1.1", "192.168.1.2"]
+    with patch("openstack_helper.common.shutil.which", return_value=None), patch(
+        "openstack_helper.common.ping_ip_address",
+        side_effect=lambda ip, timeout: ip == "192.168.1.2",
+    ) as mock_ping:
+        assert ping_ip_addresses(ips) == {"192.168.1.2"}
+        assert mock_ping.call_count == 2
+
+
+def test_ping_ip_addresses_invalid_ips():
+    """Test that invalid IPs are not pinged"""
+    with patch("openstack_helper.common.subprocess.run") as mock_run:
+        assert ping_ip_addresses(["invalid_ip", ""]) == set()
+        mock_run.assert_not_called()
+
+
+def test_ping_ip_addresses_exception():
+    """Test that it falls back to ping each IP when fping raises an OSError"""
+    with patch("openstack_helper.common.shutil.which", return_value="/usr/bin/fping"), patch(
+        "openstack_helper.common.subprocess.run", side_effect=OSError("Test OSError")
+    ), patch("openstack_helper.common.ping_ip_address", return_value=True) as mock_ping:
+        assert ping_ip_addresses(["192.168.1.1"]) == {"192.168.1.1"}
+        mock_ping.assert_called_once_with("192.168.1.1", timeout=1)
+
+
+@pytest.mark.parametrize("returncode", [2, 3, 4])
+def test_ping_ip_addresses_fping_error(returncode):
+    """Test that a failed fping run is not read as no IP reachable"""
+    ips = ["192.168.1.1", "192.168.1.2"]
+    with patch("openstack_helper.common.shutil.which", return_value="/usr/bin/fping"), patch(
+        "openstack_helper.common.subprocess.run",
+        return_value=Mock(returncode=returncode, stdout="", stderr="fping: error"),
+    ), patch(
+        "openstack_helper.common.ping_ip_address",
+        side_effect=lambda ip, timeout: ip == "192.168.1.2",
+    ) as mock_ping:
+        assert ping_ip_addresses(ips) == {"192.168.1.2"}
+        assert mock_ping.call_count == 2
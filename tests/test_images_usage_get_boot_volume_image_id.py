@@ -0,0 +1,52 @@
+# test_images_usage_get_boot_volume_image_id.py
+
+"""Unit tests for the get_boot_volume_image_id function."""
+
+from unittest.mock import Mock
+
+from openstack_helper.images_usage import get_boot_volume_image_id
+
+
+def make_volume(volume_id, device, image_id):
+    return Mock(
+        id=volume_id,
+        attachments=[{"device": device}],
+        volume_image_metadata={"image_id": image_id},
+    )
+
+
+def test_get_boot_volume_image_id_root_device_match():
+    """Return the image id of the volume attached as the root device"""
+    volumes = {
+        "vol1": make_volume("vol1", "/dev/vdb", "image1"),
+        "vol2": make_volume("vol2", "/dev/vda", "image2"),
+    }
+    openstack_api = Mock()
+    openstack_api.volume.get_volume.side_effect = volumes.get
+    server = Mock(
+        root_device_name="/dev/vda", attached_volumes=[Mock(id="vol1"), Mock(id="vol2")]
+    )
+
+    assert get_boot_volume_image_id(server, openstack_api) == "image2"
+    assert openstack_api.volume.get_volume.call_count == 2
+
+
+def test_get_boot_volume_image_id_stops_at_root_device():
+    """Do not fetch the volumes attached after the root device"""
+    openstack_api = Mock()
+    openstack_api.volume.get_volume.return_value = make_volume("vol1", "/dev/vda", "image1")
+    server = Mock(
+        root_device_name="/dev/vda", attached_volumes=[Mock(id="vol1"), Mock(id="vol2")]
+    )
+
+    assert get_boot_volume_image_id(server, openstack_api) == "image1"
+    openstack_api.volume.get_volume.assert_called_once_with("vol1")
+
+
+def test_get_boot_volume_image_id_no_attached_volumes():
+    """Return None without calling the volume API"""
+    openstack_api = Mock()
+    server = Mock(root_device_name="/dev/vda", attached_volumes=[])
+
+    assert get_boot_volume_image_id(server, openstack_api) is None
+    openstack_api.volume.get_volume.assert_not_called()
@@ -0,0 +1,42 @@
+# test_images_usage_get_filtered_images.py
+
+"""Unit tests for the get_filtered_images function."""
+
+import argparse
+from unittest.mock import Mock
+
+from openstack_helper.images_usage import get_filtered_images
+
+
+def make_args(**kwargs):
+    defaults = {"name": None, "tag": None, "image_id": None, "days": None}
+    defaults.update(kwargs)
+    return argparse.Namespace(**defaults)
+
+
+def test_get_filtered_images_no_filters():
+    """No filter is sent to Glance when the user does not provide one"""
+    openstack_api = Mock()
+    openstack_api.image.list_images.return_value = []
+
+    assert not get_filtered_images(openstack_api, make_args())
+    openstack_api.image.list_images.assert_called_once_with()
+
+
+def test_get_filtered_images_server_side_filters():
+    """All user filters are sent to Glance"""
+    image = Mock(id="image1", status="active", visibility="public")
+    image.name = "img1"
+    image.created_at = "2024-01-01T00:00:00Z"
+    openstack_api = Mock()
+    openstack_api.image.list_images.return_value = [image]
+
+    args = make_args(name="img1", tag="a,b", image_id="image1", days=30)
+    image_info_map = get_filtered_images(openstack_api, args)
+
+    assert list(image_info_map) == ["image1"]
+    query_params = openstack_api.image.list_images.call_args.kwargs
+    assert query_params["name"] == "img1"
+    assert query_params["tag"] == ["a", "b"]
+    assert query_params["id"] == "image1"
+    assert query_params["created_at"].startswith("lte:")
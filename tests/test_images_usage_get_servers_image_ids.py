@@ -0,0 +1,91 @@
+# test_images_usage_get_servers_image_ids.py
+
+"""Unit tests for the get_servers_image_ids and add_servers_to_images functions."""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+from openstack_helper.images_usage import (
+    ImageInfo,
+    add_servers_to_images,
+    get_servers_image_ids,
+)
+
+
+def make_server(server_id, image_id=None):
+    server = Mock(id=server_id, image={"id": image_id} if image_id else {})
+    server.name = f"name-{server_id}"
+    return server
+
+
+def test_get_servers_image_ids_mixed_boot_sources():
+    """Servers booted from image and from volume are returned in listing order"""
+    servers = [
+        make_server("vm1", image_id="image1"),
+        make_server("vm2"),
+        make_server("vm3", image_id="image1"),
+        make_server("vm4"),
+    ]
+    openstack_api = Mock()
+    openstack_api.compute.list_servers.return_value = servers
+
+    with patch(
+        "openstack_helper.images_usage.get_boot_volume_image_id",
+        side_effect=lambda server, _api: {"vm2": "image1", "vm4": "image2"}[server.id],
+    ) as mock_volume_image:
+        servers_image_ids = get_servers_image_ids(openstack_api, max_workers=2)
+
+    # Only servers booted from volume need volume lookups
+    assert mock_volume_image.call_count == 2
+    assert [(server.id, image_id) for server, image_id in servers_image_ids] == [
+        ("vm1", "image1"),
+        ("vm2", "image1"),
+        ("vm3", "image1"),
+        ("vm4", "image2"),
+    ]
+
+
+def test_get_servers_image_ids_bounds_volume_requests():
+    """No more than max_workers volume requests are in flight at once"""
+    servers = [make_server(f"vm{i}") for i in range(6)]
+    for server in servers:
+        server.root_device_name = "/dev/vda"
+        server.attached_volumes = [Mock(id=f"{server.id}-vol{i}") for i in range(3)]
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+
+    def get_volume(volume_id):
+        with lock:
+            in_flight.append(volume_id)
+            peak.append(len(in_flight))
+        time.sleep(0.01)
+        with lock:
+            in_flight.remove(volume_id)
+        return Mock(id=volume_id, attachments=[{"device": "/dev/vdb"}])
+
+    openstack_api = Mock()
+    openstack_api.compute.list_servers.return_value = servers
+    openstack_api.volume.get_volume.side_effect = get_volume
+
+    get_servers_image_ids(openstack_api, max_workers=2)
+
+    assert openstack_api.volume.get_volume.call_count == 18
+    assert max(peak) <= 2
+
+
+def test_add_servers_to_images():
+    """Servers are associated only with images in image_info_map"""
+    image_info_map = {
+        "image1": ImageInfo("image1", "img1", "active", "public", "2024-01-01T00:00:00Z"),
+    }
+    servers_image_ids = [
+        (make_server("vm1"), "image1"),
+        (make_server("vm2"), "image2"),
+        (make_server("vm3"), None),
+    ]
+
+    add_servers_to_images(image_info_map, servers_image_ids)
+
+    assert [server.id for server in image_info_map["image1"].servers] == ["vm1"]
@@ -0,0 +1,35 @@
+# test_loadbalancer_flavors_get_basic_info.py
+
+"""Unit tests for the Flavor get_basic_info method."""
+
+from openstack_helper.loadbalancer_flavors import ComputeFlavor, Flavor, FlavorProfile
+
+
+def test_get_basic_info_with_profile_and_compute_flavor():
+    flavor = Flavor(
+        id="flavor1",
+        name="small",
+        description="Small flavor",
+        is_enabled=True,
+        flavor_profile=FlavorProfile(
+            id="profile1", name="amphora-small", provider_name="amphora", flavor_data="{}"
+        ),
+        compute_flavor=ComputeFlavor(
+            id="cf1", name="m1.small", vcpus=1, ram=2048, disk=20, extra_specs={}
+        ),
+    )
+
+    assert flavor.get_basic_info() == (
+        "flavor1",
+        "small",
+        "Small flavor",
+        "True",
+        "amphora-small (Provider: amphora)",
+        "m1.small (Resources: vCPUs:1 RAM:2048)",
+    )
+
+
+def test_get_basic_info_without_profile():
+    flavor = Flavor(id="flavor1", name="small", description="", is_enabled=False)
+
+    assert flavor.get_basic_info() == ("flavor1", "small", "", "False", "N/A", "N/A")
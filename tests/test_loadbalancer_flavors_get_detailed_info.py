@@ -0,0 +1,53 @@
+# test_loadbalancer_flavors_get_detailed_info.py
+
+"""Unit tests for the Flavor get_detailed_info method."""
+
+from openstack_helper.loadbalancer_flavors import ComputeFlavor, Flavor, FlavorProfile
+
+
+def test_get_detailed_info_with_profile_and_compute_flavor():
+    flavor = Flavor(
+        id="flavor1",
+        name="small",
+        description="Small flavor",
+        is_enabled=True,
+        flavor_profile=FlavorProfile(
+            id="profile1",
+            name="amphora-small",
+            provider_name="amphora",
+            flavor_data='{"compute_flavor": "cf1"}',
+        ),
+        compute_flavor=ComputeFlavor(
+            id="cf1", name="m1.small", vcpus=1, ram=2048, disk=20, extra_specs={}
+        ),
+    )
+
+    assert flavor.get_detailed_info() == {
+        "Flavor Id": "flavor1",
+        "Flavor Name": "small",
+        "Flavor Description": "Small flavor",
+        "Flavor Is_enabled": True,
+        "Flavor_Profile Id": "profile1",
+        "Flavor_Profile Name": "amphora-small",
+        "Flavor_Profile Provider_name": "amphora",
+        "Flavor_Profile Flavor_data": '{"compute_flavor": "cf1"}',
+        "Compute_Flavor Id": "cf1",
+        "Compute_Flavor Name": "m1.small",
+        "Compute_Flavor Vcpus": 1,
+        "Compute_Flavor Ram": 2048,
+        "Compute_Flavor Disk": 20,
+        "Compute_Flavor Extra_specs": {},
+    }
+
+
+def test_get_detailed_info_without_profile():
+    flavor = Flavor(id="flavor1", name="small", description="", is_enabled=False)
+
+    assert flavor.get_detailed_info() == {
+        "Flavor Id": "flavor1",
+        "Flavor Name": "small",
+        "Flavor Description": "",
+        "Flavor Is_enabled": False,
+        "Flavor_Profile": "N/A",
+        "Compute_Flavor": "N/A",
+    }
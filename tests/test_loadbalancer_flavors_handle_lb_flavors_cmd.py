@@ -0,0 +1,92 @@
+# test_loadbalancer_flavors_handle_lb_flavors_cmd.py
+
+"""Unit tests for the handle_lb_flavors_cmd function."""
+
+import argparse
+import time
+from unittest.mock import Mock, patch
+
+from openstack_helper.loadbalancer_flavors import handle_lb_flavors_cmd
+
+
+def make_args(**kwargs):
+    defaults = {"flavor_id": None, "flavor_name": None, "detail": False, "max_workers": 4}
+    defaults.update(kwargs)
+    return argparse.Namespace(**defaults)
+
+
+def make_flavor(flavor_id):
+    flavor = Mock(id=flavor_id, description="", is_enabled=True, flavor_profile_id=None)
+    flavor.name = f"name-{flavor_id}"
+    return flavor
+
+
+def test_handle_lb_flavors_cmd_preserves_listing_order():
+    """Flavors are displayed in the same order they are listed"""
+    flavors = [make_flavor(f"flavor{i}") for i in range(10)]
+    openstack_api = Mock()
+    openstack_api.loadbalancer.list_flavors.return_value = flavors
+
+    with patch("openstack_helper.loadbalancer_flavors.display_flavors") as mock_display:
+        handle_lb_flavors_cmd(openstack_api, make_args())
+
+    flavors_list, detail = mock_display.call_args.args
+    assert [flavor.id for flavor in flavors_list] == [flavor.id for flavor in flavors]
+    assert detail is False
+
+
+def test_handle_lb_flavors_cmd_no_flavors():
+    """Test no flavors to process"""
+    openstack_api = Mock()
+    openstack_api.loadbalancer.list_flavors.return_value = []
+
+    with patch("openstack_helper.loadbalancer_flavors.display_flavors") as mock_display:
+        handle_lb_flavors_cmd(openstack_api, make_args())
+
+    mock_display.assert_called_once_with([], False)
+
+
+def test_handle_lb_flavors_cmd_shared_lookups_are_cached():
+    """Flavor profiles and compute flavors shared by flavors are retrieved only once"""
+    flavors = [make_flavor(f"flavor{i}") for i in range(3)]
+    for flavor in flavors:
+        flavor.flavor_profile_id = "profile1"
+    openstack_api = Mock()
+    openstack_api.loadbalancer.list_flavors.return_value = flavors
+    openstack_api.loadbalancer.find_flavor_profile.return_value = Mock(
+        id="profile1", provider_name="amphora", flavor_data='{"compute_flavor": "cf1"}'
+    )
+    openstack_api.compute.find_flavor.return_value = Mock(
+        id="cf1", vcpus=1, ram=1024, disk=10, extra_specs={}
+    )
+
+    with patch("openstack_helper.loadbalancer_flavors.display_flavors") as mock_display:
+        handle_lb_flavors_cmd(openstack_api, make_args(max_workers=1))
+
+    openstack_api.loadbalancer.find_flavor_profile.assert_called_once_with("profile1")
+    openstack_api.compute.find_flavor.assert_called_once_with("cf1")
+    flavors_list, _ = mock_display.call_args.args
+    assert all(flavor.compute_flavor.vcpus == 1 for flavor in flavors_list)
+
+
+def test_handle_lb_flavors_cmd_shared_lookups_are_cached_concurrently():
+    """Concurrent workers share a single lookup of the same flavor profile"""
+    flavors = [make_flavor(f"flavor{i}") for i in range(4)]
+    for flavor in flavors:
+        flavor.flavor_profile_id = "profile1"
+    profile = Mock(id="profile1", provider_name="amphora", flavor_data="{}")
+
+    def find_flavor_profile(_name_or_id):
+        time.sleep(0.05)
+        return profile
+
+    openstack_api = Mock()
+    openstack_api.loadbalancer.list_flavors.return_value = flavors
+    openstack_api.loadbalancer.find_flavor_profile.side_effect = find_flavor_profile
+
+    with patch("openstack_helper.loadbalancer_flavors.display_flavors") as mock_display:
+        handle_lb_flavors_cmd(openstack_api, make_args(max_workers=4))
+
+    openstack_api.loadbalancer.find_flavor_profile.assert_called_once_with("profile1")
+    flavors_list, _ = mock_display.call_args.args
+    assert all(flavor.flavor_profile.id == "profile1" for flavor in flavors_list)
@@ -0,0 +1,42 @@
+# test_logging_config_setup_logging.py
+
+"""Unit tests for the setup_logging function."""
+
+import logging
+
+import pytest
+
+from openstack_helper.logging_config import HANDLER_NAME, setup_logging
+
+
+@pytest.fixture(name="root_logger")
+def root_logger_fixture():
+    """
+    Fixture to restore the root logger handlers and level after the test.
+    """
+    root_logger = logging.getLogger()
+    handlers = list(root_logger.handlers)
+    level = root_logger.level
+    yield root_logger
+    root_logger.handlers = handlers
+    root_logger.setLevel(level)
+
+
+def test_setup_logging_called_twice(root_logger):
+    """Calling setup_logging twice must not duplicate the handler"""
+    setup_logging(logging.INFO)
+    setup_logging(logging.DEBUG)
+
+    handlers = [h for h in root_logger.handlers if h.get_name() == HANDLER_NAME]
+    assert len(handlers) == 1
+    assert root_logger.level == logging.DEBUG
+
+
+def test_setup_logging_keeps_global_logging_flags(root_logger):
+    """setup_logging must not change process-wide logging record flags"""
+    flags = (logging.logThreads, logging.logProcesses, logging.logMultiprocessing)
+
+    setup_logging(logging.INFO)
+
+    assert root_logger.level == logging.INFO
+    assert (logging.logThreads, logging.logProcesses, logging.logMultiprocessing) == flags
@@ -0,0 +1,42 @@
+# test_main_main.py
+
+"""Unit tests for the main function."""
+
+from unittest.mock import patch
+
+import pytest
+
+from openstack_helper.main import main
+
+UUID = "123e4567-e89b-12d3-a456-426614174000"
+
+
+@pytest.mark.parametrize("max_workers", ["0", "101", "100000"])
+def test_main_invalid_max_workers(max_workers):
+    """An out of range --max-workers is an argument error, raised before connecting"""
+    argv = ["openstack-helper", "ca", "--uuid", UUID, "--max-workers", max_workers]
+    with patch("sys.argv", argv), patch(
+        "openstack_helper.openstack_api.OpenStackAPI"
+    ) as mock_api, patch("openstack_helper.main.setup_logging"):
+        with pytest.raises(SystemExit):
+            main()
+
+    mock_api.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "pool_args, expected_pool_size",
+    [([], 30), (["--pool-size", "50"], 50)],
+)
+def test_main_pool_size(pool_args, expected_pool_size):
+    """The connection pool is at least as large as --max-workers"""
+    argv = ["openstack-helper", *pool_args, "ca", "--uuid", UUID, "--max-workers", "30"]
+    with patch("sys.argv", argv), patch(
+        "openstack_helper.openstack_api.OpenStackAPI"
+    ) as mock_api, patch("openstack_helper.main.setup_logging"), patch(
+        "openstack_helper.check_allocations.handle_check_allocations_cmd"
+    ) as mock_handler:
+        main()
+
+    mock_api.assert_called_once_with(insecure=False, pool_size=expected_pool_size)
+    mock_handler.assert_called_once()
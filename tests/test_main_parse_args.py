@@ -0,0 +1,46 @@
+# test_main_parse_args.py
+
+"""Unit tests for the parse_args function."""
+
+import importlib
+from unittest.mock import patch
+
+import pytest
+
+from openstack_helper.main import parse_args
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["unused_ports"],
+        ["images_usage"],
+        ["resource_provider"],
+        ["check_allocations", "--uuid", "123e4567-e89b-12d3-a456-426614174000"],
+        ["router_info"],
+        ["lb_flavors"],
+    ],
+)
+def test_parse_args_subcommand_handler(argv):
+    """Each subcommand points to an existing handler function"""
+    with patch("sys.argv", ["openstack-helper", *argv]):
+        args = parse_args()
+
+    handler = getattr(importlib.import_module(args.handler_module), args.handler_name)
+    assert callable(handler)
+
+
+@pytest.mark.parametrize("flavor_name", ["images_usage", "up"])
+def test_parse_args_option_value_named_as_subcommand(flavor_name):
+    """An option value equal to a subcommand name does not select that subcommand"""
+    with patch(
+        "sys.argv",
+        ["openstack-helper", "--debug", "lbf", "--flavor-name", flavor_name, "--detail"],
+    ):
+        args = parse_args()
+
+    assert args.debug is True
+    assert args.command == "lbf"
+    assert args.flavor_name == flavor_name
+    assert args.detail is True
+    assert args.max_workers == 20
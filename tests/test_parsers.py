@@ -7,7 +7,12 @@ from unittest.mock import call, patch
 
 import pytest
 
-from openstack_helper.main import parse_uuid, parse_uuid_list
+from openstack_helper.main import (
+    parse_max_workers,
+    parse_pool_size,
+    parse_uuid,
+    parse_uuid_list,
+)
 
 VALID_UUIDS = [
     "123e4567-e89b-12d3-a456-426614174000",
@@ -157,3 +162,50 @@ def test_parse_uuid_list_invalid_uuid_second_position(
 
     mock_is_valid_uuid.assert_has_calls(expected_calls, any_order=False)
     assert mock_is_valid_uuid.call_count == len(expected_calls)
+
+
+def test_parse_uuid_list_whitespace_inside_item(mock_is_valid_uuid):
+    """
+    Test parse_uuid_list keeps whitespace inside an item, so it is one invalid UUID.
+    """
+    mock_is_valid_uuid.return_value = False
+    with pytest.raises(ArgumentTypeError) as exc_info:
+        parse_uuid_list(" invalid1 invalid2 ,invalid3")
+    assert "Invalid UUID: 'invalid1 invalid2'" in str(exc_info.value)
+    mock_is_valid_uuid.assert_called_once_with("invalid1 invalid2")
+
+
+@pytest.mark.parametrize("pool_size_str, expected_output", [("1", 1), ("20", 20)])
+def test_parse_pool_size_valid(pool_size_str, expected_output):
+    """
+    Test parse_pool_size with valid pool sizes.
+    """
+    assert parse_pool_size(pool_size_str) == expected_output
+
+
+@pytest.mark.parametrize("pool_size_str", ["0", "-1", "abc", ""])
+def test_parse_pool_size_invalid(pool_size_str):
+    """
+    Test parse_pool_size rejects pool sizes lower than 1 and non integers.
+    """
+    with pytest.raises(ArgumentTypeError) as exc_info:
+        parse_pool_size(pool_size_str)
+    assert f"Invalid pool size: '{pool_size_str}'" in str(exc_info.value)
+
+
+@pytest.mark.parametrize("max_workers_str, expected_output", [("1", 1), ("100", 100)])
+def test_parse_max_workers_valid(max_workers_str, expected_output):
+    """
+    Test parse_max_workers with values within the range 1-100.
+    """
+    assert parse_max_workers(max_workers_str) == expected_output
+
+
+@pytest.mark.parametrize("max_workers_str", ["0", "101", "100000", "abc"])
+def test_parse_max_workers_invalid(max_workers_str):
+    """
+    Test parse_max_workers rejects values outside the range 1-100 and non integers.
+    """
+    with pytest.raises(ArgumentTypeError) as exc_info:
+        parse_max_workers(max_workers_str)
+    assert f"Invalid max workers: '{max_workers_str}'" in str(exc_info.value)
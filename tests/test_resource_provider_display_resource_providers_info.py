@@ -0,0 +1,37 @@
+# test_resource_provider_display_resource_providers_info.py
+
+"""Unit tests for the display_resource_providers_info function."""
+
+from unittest.mock import patch
+
+from openstack_helper.resource_provider import (
+    ResourceProviderInfo,
+    display_resource_providers_info,
+)
+
+
+def test_display_resource_providers_info_plain_text(capsys):
+    """Plain text output has the display names and formatted values"""
+    resource = ResourceProviderInfo(
+        provider_name="host1",
+        resource_class="VCPU",
+        total=8,
+        reserved=0,
+        usage=3,
+        allocation_ratio=4.0,
+    )
+    with patch("openstack_helper.resource_provider.RICH_AVAILABLE", False):
+        display_resource_providers_info([resource])
+
+    header, row = capsys.readouterr().out.splitlines()
+    assert header.split("\t") == [
+        "Provider Name",
+        "Resource Class",
+        "Total",
+        "Reserved",
+        "Used",
+        "Conf Alloc Ratio",
+        "Alloc Ratio Used (%)",
+        "Current Alloc Ratio",
+    ]
+    assert row.split("\t") == ["host1", "VCPU", "8", "0", "3", "4.0", "9.38%", "0.38"]
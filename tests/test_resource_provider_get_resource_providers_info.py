@@ -0,0 +1,65 @@
+# test_resource_provider_get_resource_providers_info.py
+
+"""Unit tests for the get_resource_providers_info function."""
+
+from unittest.mock import Mock
+
+from openstack_helper.resource_provider import get_resource_providers_info
+
+
+def make_provider(name):
+    provider = Mock()
+    provider.name = name
+    return provider
+
+
+def make_inventory(resource_class, total):
+    return Mock(resource_class=resource_class, total=total, reserved=0, allocation_ratio=1.0)
+
+
+def test_get_resource_providers_info_preserves_provider_order():
+    """Results follow the resource provider listing order"""
+    providers = [make_provider(f"host{i}") for i in range(10)]
+    openstack_api = Mock()
+    openstack_api.placement.retrieve_resource_providers.return_value = iter(providers)
+    openstack_api.placement.retrieve_provider_usage.return_value = {"VCPU": 2}
+    openstack_api.placement.retrieve_resource_provider_inventories.return_value = [
+        make_inventory("VCPU", 8),
+        make_inventory("MEMORY_MB", 1024),
+    ]
+
+    results = get_resource_providers_info(
+        openstack_api, resource_classes=["VCPU"], filters={}, max_workers=4
+    )
+
+    assert [info.provider_name for info in results] == [p.name for p in providers]
+    assert {info.resource_class for info in results} == {"VCPU"}
+    assert all(info.usage == 2 for info in results)
+    assert openstack_api.placement.retrieve_provider_usage.call_count == len(providers)
+
+
+def test_get_resource_providers_info_no_providers():
+    """Test no resource providers found"""
+    openstack_api = Mock()
+    openstack_api.placement.retrieve_resource_providers.return_value = iter([])
+
+    assert not get_resource_providers_info(openstack_api, filters={"name": "missing"})
+    openstack_api.placement.retrieve_provider_usage.assert_not_called()
+
+
+def test_get_resource_providers_info_skips_providers_without_selected_class():
+    """Inventories are not retrieved for providers without a selected resource class"""
+    openstack_api = Mock()
+    openstack_api.placement.retrieve_resource_providers.return_value = iter(
+        [make_provider("bandwidth")]
+    )
+    openstack_api.placement.retrieve_provider_usage.return_value = {
+        "NET_BW_EGR_KILOBIT_PER_SEC": 0
+    }
+
+    results = get_resource_providers_info(
+        openstack_api, resource_classes=["VCPU"], filters={}, max_workers=4
+    )
+
+    assert not results
+    openstack_api.placement.retrieve_resource_provider_inventories.assert_not_called()
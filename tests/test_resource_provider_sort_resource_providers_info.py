@@ -0,0 +1,52 @@
+# test_resource_provider_sort_resource_providers_info.py
+
+"""Unit tests for the sort_resource_providers_info function."""
+
+import pytest
+
+from openstack_helper.resource_provider import (
+    ResourceProviderInfo,
+    sort_resource_providers_info,
+)
+
+
+def make_info(provider_name, resource_class, usage):
+    return ResourceProviderInfo(
+        provider_name=provider_name,
+        resource_class=resource_class,
+        total=10,
+        reserved=0,
+        usage=usage,
+        allocation_ratio=1.0,
+    )
+
+
+RESOURCES = [
+    make_info("host2", "VCPU", 5),
+    make_info("host1", "VCPU", 5),
+    make_info("host1", "MEMORY_MB", 1),
+]
+
+
+@pytest.mark.parametrize(
+    "sort_by_columns, expected",
+    [
+        (["Provider Name"], [("host1", "VCPU"), ("host1", "MEMORY_MB"), ("host2", "VCPU")]),
+        (
+            ["Used", "Provider Name"],
+            [("host1", "MEMORY_MB"), ("host1", "VCPU"), ("host2", "VCPU")],
+        ),
+        (
+            ["Provider Name", "Resource Class"],
+            [("host1", "MEMORY_MB"), ("host1", "VCPU"), ("host2", "VCPU")],
+        ),
+        (["Unknown"], [("host2", "VCPU"), ("host1", "VCPU"), ("host1", "MEMORY_MB")]),
+    ],
+)
+def test_sort_resource_providers_info(sort_by_columns, expected):
+    """Sort by one or more display name columns"""
+    resources = list(RESOURCES)
+    result = sort_resource_providers_info(resources, sort_by_columns)
+
+    assert result is resources
+    assert [(info.provider_name, info.resource_class) for info in result] == expected
@@ -0,0 +1,76 @@
+# test_routers_info_get_all_router_data.py
+
+"""Unit tests for the get_all_router_data function."""
+
+from unittest.mock import Mock, patch
+
+from openstack_helper.routers_info import PORT_FIELDS, get_all_router_data
+
+
+def make_router(router_id, gateway_network_id=None):
+    router = Mock(id=router_id, is_distributed=False)
+    router.name = f"name-{router_id}"
+    router.external_gateway_info = (
+        {"network_id": gateway_network_id} if gateway_network_id else None
+    )
+    return router
+
+
+def make_port(port_id, device_id, network_id):
+    return Mock(
+        id=port_id, device_id=device_id, network_id=network_id, status="ACTIVE", fixed_ips=[]
+    )
+
+
+def test_get_all_router_data_single_ports_request():
+    """Ports of all routers are retrieved with one request and grouped by router"""
+    openstack_api = Mock()
+    openstack_api.network.list_routers.return_value = [
+        make_router("r1", gateway_network_id="ext"),
+        make_router("r2"),
+        make_router("r3"),
+    ]
+    openstack_api.network.retrieve_ports.return_value = [
+        make_port("p1", "r1", "net1"),
+        make_port("p2", "r2", "net2"),
+        make_port("p3", "r1", "net2"),
+    ]
+
+    routers_info, all_network_ids = get_all_router_data(openstack_api, None, None)
+
+    openstack_api.network.retrieve_ports.assert_called_once_with(
+        device_id=["r1", "r2", "r3"], fields=PORT_FIELDS
+    )
+    assert [[port.id for port in router.ports] for router in routers_info] == [
+        ["p1", "p3"],
+        ["p2"],
+        [],
+    ]
+    assert all_network_ids == {"ext", "net1", "net2"}
+
+
+def test_get_all_router_data_chunks_router_ids():
+    """Router IDs are split in chunks across ports requests"""
+    openstack_api = Mock()
+    openstack_api.network.list_routers.return_value = [make_router(f"r{i}") for i in range(5)]
+    openstack_api.network.retrieve_ports.return_value = []
+
+    with patch("openstack_helper.routers_info.NEUTRON_IDS_CHUNK_SIZE", 2):
+        get_all_router_data(openstack_api, None, None)
+
+    assert [
+        call.kwargs["device_id"] for call in openstack_api.network.retrieve_ports.mock_calls
+    ] == [
+        ["r0", "r1"],
+        ["r2", "r3"],
+        ["r4"],
+    ]
+
+
+def test_get_all_router_data_no_routers():
+    """Test no routers found"""
+    openstack_api = Mock()
+    openstack_api.network.list_routers.return_value = []
+
+    assert get_all_router_data(openstack_api, ["r1"], None) == ([], set())
+    openstack_api.network.retrieve_ports.assert_not_called()
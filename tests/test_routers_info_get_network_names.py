@@ -0,0 +1,28 @@
+# test_routers_info_get_network_names.py
+
+"""Unit tests for the get_network_names function."""
+
+from unittest.mock import Mock, patch
+
+from openstack_helper.routers_info import get_network_names
+
+
+def make_network(network_id):
+    network = Mock(id=network_id)
+    network.name = f"name-{network_id}"
+    return network
+
+
+def test_get_network_names_bulk_requests():
+    """Network names are retrieved with one request per chunk of IDs"""
+    openstack_api = Mock()
+    openstack_api.network.list_networks.side_effect = lambda id, fields: [
+        make_network(network_id) for network_id in id if network_id != "missing"
+    ]
+
+    with patch("openstack_helper.routers_info.NEUTRON_IDS_CHUNK_SIZE", 2):
+        network_map = get_network_names(openstack_api, {"net1", "net2", "missing"})
+
+    assert network_map == {"net1": "name-net1", "net2": "name-net2"}
+    assert openstack_api.network.list_networks.call_count == 2
+    openstack_api.network.find_network.assert_not_called()
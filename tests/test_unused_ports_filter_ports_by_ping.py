@@ -13,6 +13,8 @@ from openstack_helper.unused_ports import filter_ports_by_ping
 class MockPort:
     """A mock Port class."""
 
+    __slots__ = ("id", "fixed_ips")
+
     # pylint: disable=too-few-public-methods
     def __init__(self, port_id, fixed_ips):
         self.id = port_id
@@ -28,6 +30,14 @@ def mock_ports_func():
     ]
 
 
+@pytest.fixture(name="mock_ping_ip_addresses", autouse=True)
+def mock_ping_ip_addresses_func():
+    with patch(
+        "openstack_helper.unused_ports.ping_ip_addresses", return_value=set()
+    ) as mock_ping:
+        yield mock_ping
+
+
 def test_filter_ports_by_ping_all_reachable(mock_ports):
     """All ports are reachable, so none should be returned"""
     with patch("openstack_helper.unused_ports.ping_port_ip_addresses", return_value=True):
@@ -43,7 +53,7 @@ def test_filter_ports_by_ping_all_unreachable(mock_ports):
 
 
 def test_filter_ports_by_ping_mixed_reachability(mock_ports):
-    def side_effect(port):
+    def side_effect(port, _reachable_ips):
         return port.id == "port2"  # Only port2 is reachable
 
     with patch(
@@ -59,3 +69,23 @@ def test_filter_ports_by_ping_no_eligible_ports():
     """Test no ports to process"""
     result = filter_ports_by_ping([], max_workers=2)
     assert not result
+
+
+def test_filter_ports_by_ping_single_batch(mock_ping_ip_addresses):
+    """All IP addresses are pinged once, in a single batch"""
+    ports = [
+        MockPort(port_id="port1", fixed_ips=[{"ip_address": "192.168.1.1"}]),
+        MockPort(
+            port_id="port2",
+            fixed_ips=[{"ip_address": "192.168.1.2"}, {"ip_address": "192.168.1.1"}],
+        ),
+        MockPort(port_id="port3", fixed_ips=[{"ip_address": "192.168.1.3"}]),
+    ]
+    mock_ping_ip_addresses.return_value = {"192.168.1.2"}
+
+    result = filter_ports_by_ping(ports, max_workers=2)
+
+    mock_ping_ip_addresses.assert_called_once_with(
+        ["192.168.1.1", "192.168.1.2", "192.168.1.3"], max_workers=2
+    )
+    assert [port.id for port in result] == ["port1", "port3"]
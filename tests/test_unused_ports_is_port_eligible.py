@@ -2,97 +2,38 @@
 
 """Unit tests for the is_port_eligible function."""
 
-from unittest.mock import Mock
+import logging
+from dataclasses import replace
 
 import pytest
 
 from openstack_helper.unused_ports import is_port_eligible
+from tests.port_cases import PORT_ELIGIBILITY_CASES
 
 
-@pytest.fixture(name="mock_port")
-def mock_port_fixture():
+@pytest.mark.parametrize("overrides,expected", PORT_ELIGIBILITY_CASES)
+def test_is_port_eligible(eligible_port, overrides, expected):
     """
-    Fixture to provide a mock port object with default values.
+    Test each condition for eligibility, starting from an eligible port.
     """
-    port = Mock()
-    port.id = "mock_port_id"
-    port.name = "mock_port_name"
-    return port
+    port = replace(eligible_port, **overrides)
 
-
-def test_port_eligible_all_checks_pass(mock_port):
-    """
-    Test case where all conditions for eligibility are met.
-    """
-    mock_port.status = "DOWN"
-    mock_port.binding_host_id = None
-    mock_port.binding_vif_details = None
-    mock_port.binding_vif_type = "unbound"
-    mock_port.device_owner = "expected_device_owner"
-
-    assert is_port_eligible(mock_port, "expected_device_owner") is True
-
-
-def test_port_not_eligible_status_not_down(mock_port):
-    """
-    Test case where the port status is not 'DOWN'
-    """
-    mock_port.status = "ACTIVE"
-    mock_port.binding_host_id = None
-    mock_port.binding_vif_details = None
-    mock_port.binding_vif_type = "unbound"
-    mock_port.device_owner = "expected_device_owner"
-
-    assert is_port_eligible(mock_port, "expected_device_owner") is False
+    assert is_port_eligible(port, "some_device_owner") is expected
 
 
-def test_port_not_eligible_binding_host_id_present(mock_port):
+def test_port_not_eligible_debug_logs_all_failed_checks(eligible_port, caplog):
     """
-    Test case where the port has a binding_host_id
+    Test case where debug logging shows every failed check
     """
-    mock_port.status = "DOWN"
-    mock_port.binding_host_id = "some_host_id"
-    mock_port.binding_vif_details = None
-    mock_port.binding_vif_type = "unbound"
-    mock_port.device_owner = "expected_device_owner"
+    port = replace(eligible_port, status="ACTIVE", binding_vif_type="ovs")
 
-    assert is_port_eligible(mock_port, "expected_device_owner") is False
-
-
-def test_port_not_eligible_binding_vif_details_present(mock_port):
-    """
-    Test case where the port has binding_vif_details
-    """
-    mock_port.status = "DOWN"
-    mock_port.binding_host_id = None
-    mock_port.binding_vif_details = {"vif_details": "present"}
-    mock_port.binding_vif_type = "unbound"
-    mock_port.device_owner = "expected_device_owner"
-
-    assert is_port_eligible(mock_port, "expected_device_owner") is False
-
-
-def test_port_not_eligible_binding_vif_type_not_unbound(mock_port):
-    """
-    Test case where the port binding_vif_type is not 'unbound'
-    """
-    mock_port.status = "DOWN"
-    mock_port.binding_host_id = None
-    mock_port.binding_vif_details = None
-    mock_port.binding_vif_type = "some_other_type"
-    mock_port.device_owner = "expected_device_owner"
-
-    assert is_port_eligible(mock_port, "expected_device_owner") is False
-
-
-def test_port_not_eligible_device_owner_mismatch(mock_port):
-    """
-    Test case where the port device_owner does not match the expected value
-    """
-    mock_port.status = "DOWN"
-    mock_port.binding_host_id = None
-    mock_port.binding_vif_details = None
-    mock_port.binding_vif_type = "unbound"
-    mock_port.device_owner = "wrong_device_owner"
+    with caplog.at_level(logging.DEBUG):
+        assert is_port_eligible(port, "some_device_owner") is False
 
-    assert is_port_eligible(mock_port, "expected_device_owner") is False
+    failed_checks = [
+        record.getMessage() for record in caplog.records if "Check Failed" in record.message
+    ]
+    assert failed_checks == [
+        "Check Failed: Port status is DOWN. Value: 'ACTIVE'",
+        "Check Failed: Port binding_vif_type is 'unbound'. Value: 'ovs'",
+    ]
@@ -0,0 +1,29 @@
+# test_unused_ports_show_unused_ports.py
+
+"""Unit tests for the show_unused_ports function."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from openstack_helper.unused_ports import PORT_DISPLAY_ATTRIBUTES, show_unused_ports
+
+
+def test_show_unused_ports_plain_text(capsys):
+    """Plain text output lists every displayed attribute of each port"""
+    ports = [
+        SimpleNamespace(**{attr: f"{port_id}-{attr}" for attr in PORT_DISPLAY_ATTRIBUTES})
+        for port_id in ("port1", "port2")
+    ]
+    for port, port_id in zip(ports, ("port1", "port2")):
+        port.id = port_id
+
+    with patch("openstack_helper.unused_ports.RICH_AVAILABLE", False):
+        show_unused_ports(ports)
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 2 * (1 + len(PORT_DISPLAY_ATTRIBUTES))
+    assert lines[0] == "-- port1"
+    assert lines[1] == "   |-- id: port1"
+    assert lines[2] == "   |-- name: port1-name"
+    assert lines[1 + len(PORT_DISPLAY_ATTRIBUTES)] == "-- port2"
+    assert lines[-1] == "   |-- updated_at: port2-updated_at"